@@ -6,10 +6,16 @@ Tests correctness and performance across increasingly difficult instances.
 from __future__ import annotations
 
 import json
+import os
 import signal
 import string
 import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
+from functools import partial
+from itertools import chain
 from typing import Any
 
 import numpy as np
@@ -19,6 +25,9 @@ from solution import optimize_einsum
 # Evaluation configuration
 SEED = 42
 INSTANCES_PER_LEVEL = 5
+# Instances of a level are generated and verified in parallel processes;
+# the timed runs stay sequential so they do not compete for the CPU
+MAX_WORKERS = min(INSTANCES_PER_LEVEL, os.cpu_count() or 1)
 
 LEVELS = [
     {"name": "Level 1", "tensors": (3, 4), "timeout": 1.0},
@@ -33,19 +42,29 @@ class TimeoutError(Exception):
     """Raised when evaluation times out."""
 
 
+_alarm_seconds = 0.0
+
+
+def _alarm_handler(signum, frame):
+    raise TimeoutError(f"Timed out after {_alarm_seconds}s")
+
+
 @contextmanager
 def timeout(seconds: float):
-    """Context manager for timeout."""
-    def handler(signum, frame):
-        raise TimeoutError(f"Timed out after {seconds}s")
+    """Context manager for timeout.
 
-    old_handler = signal.signal(signal.SIGALRM, handler)
+    The SIGALRM handler is installed on first use and left in place, so each
+    instance only arms and disarms the interval timer.
+    """
+    global _alarm_seconds
+    if signal.getsignal(signal.SIGALRM) is not _alarm_handler:
+        signal.signal(signal.SIGALRM, _alarm_handler)
+    _alarm_seconds = seconds
     signal.setitimer(signal.ITIMER_REAL, seconds)
     try:
         yield
     finally:
         signal.setitimer(signal.ITIMER_REAL, 0)
-        signal.signal(signal.SIGALRM, old_handler)
 
 
 def generate_instance(
@@ -59,26 +78,30 @@ def generate_instance(
     # Available index labels
     labels = list(string.ascii_lowercase)
 
+    # Draw per-label dimensions and per-tensor sizes up front in a few
+    # vectorized calls rather than one generator call per index
+    label_dims = dict(zip(labels, rng.integers(2, 21, size=len(labels)).tolist()))  # 2-20
+    first_rank = int(rng.integers(2, 4))  # 4 is exclusive, so 2-3
+    ranks = rng.integers(2, 5, size=num_tensors - 1).tolist()  # 2-4
+    shared_counts = rng.integers(1, 3, size=num_tensors - 1).tolist()  # 1-2
+
     # Track which indices exist and their dimensions
     index_dims: dict[str, int] = {}
     tensor_indices: list[str] = []
 
     # First tensor: 2-3 random indices
-    num_indices = rng.integers(2, 4)  # 4 is exclusive, so 2-3
-    first_indices = "".join(rng.choice(labels, size=num_indices, replace=False))
+    first_indices = "".join(rng.choice(labels, size=first_rank, replace=False))
     tensor_indices.append(first_indices)
     for idx in first_indices:
-        index_dims[idx] = int(rng.integers(2, 21))  # 21 exclusive, so 2-20
+        index_dims[idx] = label_dims[idx]
 
     # Remaining tensors: share at least one index with existing tensors
     used_indices = set(first_indices)
     available_new = [l for l in labels if l not in used_indices]
 
-    for _ in range(num_tensors - 1):
-        num_indices = int(rng.integers(2, 5))  # 2-4
-
+    for num_indices, num_shared in zip(ranks, shared_counts):
         # Pick 1-2 existing indices to connect with
-        num_shared = min(int(rng.integers(1, 3)), len(used_indices), num_indices - 1)
+        num_shared = min(num_shared, len(used_indices), num_indices - 1)
         used_list = sorted(used_indices)
         shared = list(rng.choice(used_list, size=num_shared, replace=False))
 
@@ -89,14 +112,15 @@ def generate_instance(
             new_count = min(num_new, len(available_new))
             picked = list(rng.choice(available_new, size=new_count, replace=False))
             for idx in picked:
-                index_dims[idx] = int(rng.integers(2, 21))
+                index_dims[idx] = label_dims[idx]
                 available_new.remove(idx)
                 new_indices.append(idx)
             num_new -= new_count
 
-        # If we still need more indices, reuse existing ones
+        # If we still need more indices, reuse existing ones (sorted so the
+        # draw does not depend on set iteration order, i.e. PYTHONHASHSEED)
         if num_new > 0:
-            reusable = [i for i in used_indices if i not in shared]
+            reusable = [i for i in used_list if i not in shared]
             if reusable:
                 extra_count = min(num_new, len(reusable))
                 extra = list(rng.choice(reusable, size=extra_count, replace=False))
@@ -107,10 +131,7 @@ def generate_instance(
         used_indices.update(indices)
 
     # Determine output indices (indices that appear exactly once)
-    index_count: dict[str, int] = {}
-    for indices in tensor_indices:
-        for idx in indices:
-            index_count[idx] = index_count.get(idx, 0) + 1
+    index_count = Counter(chain.from_iterable(tensor_indices))
 
     output_indices = "".join(sorted(idx for idx, count in index_count.items() if count == 1))
 
@@ -128,20 +149,108 @@ def generate_instance(
     return subscripts, shapes
 
 
+def compile_contraction(subscripts: str, path: list) -> Callable[..., np.ndarray]:
+    """Precompile an einsum path into a fixed sequence of contraction steps.
+
+    Like opt_einsum's ``contract_expression``, the path is parsed and each
+    step is planned once, so calling the returned function only runs the
+    contractions. Steps follow numpy's path semantics: the listed operands
+    are removed and their result is appended.
+    """
+    if "->" in subscripts:
+        inputs_str, output_str = subscripts.split("->")
+    else:
+        inputs_str = subscripts
+        counts: dict[str, int] = {}
+        for idx in inputs_str.replace(",", ""):
+            counts[idx] = counts.get(idx, 0) + 1
+        output_str = "".join(sorted(idx for idx, count in counts.items() if count == 1))
+
+    operand_subs = inputs_str.split(",")
+    steps: list[tuple[tuple[int, ...], Callable[..., np.ndarray]]] = []
+    for contract_inds in path[1:]:
+        positions = tuple(sorted(contract_inds, reverse=True))
+        step_inputs = [operand_subs.pop(p) for p in positions]
+        if operand_subs:
+            # Keep indices still needed by the output or a remaining operand
+            needed = set(output_str).union(*operand_subs)
+            result = "".join(dict.fromkeys(idx for idx in "".join(step_inputs) if idx in needed))
+        else:
+            result = output_str
+        steps.append((positions, _compile_step(step_inputs, result)))
+        operand_subs.append(result)
+
+    if len(operand_subs) != 1:
+        msg = f"Path leaves {len(operand_subs)} operands uncontracted"
+        raise ValueError(msg)
+    if operand_subs[0] != output_str:
+        steps.append(((0,), _compile_step(operand_subs, output_str)))
+
+    def contract(*operands: np.ndarray) -> np.ndarray:
+        remaining = list(operands)
+        for positions, step in steps:
+            args = [remaining.pop(p) for p in positions]
+            remaining.append(step(*args))
+        return remaining[0]
+
+    return contract
+
+
+def _compile_step(step_inputs: list[str], result: str) -> Callable[..., np.ndarray]:
+    """Plan one contraction step, using ``np.tensordot`` (BLAS) when possible.
+
+    A pairwise step can go through tensordot when neither operand repeats an
+    index, every shared index is summed out, and every unshared index is
+    kept; this is the same test ``np.einsum`` applies internally. Other steps
+    fall back to a plain einsum call.
+    """
+    step = ",".join(step_inputs) + "->" + result
+    if len(step_inputs) != 2:
+        return partial(np.einsum, step)
+
+    subs_a, subs_b = step_inputs
+    shared = [idx for idx in subs_a if idx in subs_b]
+    dot_possible = (
+        len(set(subs_a)) == len(subs_a)
+        and len(set(subs_b)) == len(subs_b)
+        and not any(idx in result for idx in shared)
+        and all(idx in result for idx in subs_a + subs_b if idx not in shared)
+    )
+    if not dot_possible:
+        return partial(np.einsum, step)
+
+    axes = ([subs_a.index(idx) for idx in shared], [subs_b.index(idx) for idx in shared])
+    dot_subs = [idx for idx in subs_a + subs_b if idx not in shared]
+    perm = [dot_subs.index(idx) for idx in result]
+    if perm == sorted(perm):
+        return partial(np.tensordot, axes=axes)
+
+    def dot_then_transpose(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return np.tensordot(a, b, axes=axes).transpose(perm)
+
+    return dot_then_transpose
+
+
 def verify_correctness(
     subscripts: str,
     shapes: list[tuple[int, ...]],
     path: list,
     rng: np.random.Generator,
+    contract: Callable[..., np.ndarray] | None = None,
 ) -> bool:
     """Verify that the path produces correct results.
 
     Uses small tensor dimensions for fast verification - the contraction
-    order correctness is independent of tensor size.
+    order correctness is independent of tensor size. ``contract`` is the
+    path already compiled by ``compile_contraction``, if the caller has it.
     """
-    # Create small shapes for fast verification (all dims = 2)
-    small_shapes = [tuple(2 for _ in shape) for shape in shapes]
-    tensors = [rng.random(shape) for shape in small_shapes]
+    # Create small tensors for fast verification (all dims = 2), carved out of
+    # a single draw; this consumes the generator exactly like per-tensor draws
+    small_shapes = [(2,) * len(shape) for shape in shapes]
+    sizes = [2 ** len(shape) for shape in shapes]
+    flat = rng.random(sum(sizes))
+    offsets = np.cumsum(sizes)[:-1]
+    tensors = [chunk.reshape(shape) for chunk, shape in zip(np.split(flat, offsets), small_shapes)]
 
     # Compute reference result (let numpy choose the path)
     try:
@@ -151,7 +260,9 @@ def verify_correctness(
 
     # Compute result using our path
     try:
-        actual = np.einsum(subscripts, *tensors, optimize=path)
+        if contract is None:
+            contract = compile_contraction(subscripts, path)
+        actual = contract(*tensors)
     except Exception:
         return False
 
@@ -159,18 +270,23 @@ def verify_correctness(
     return np.allclose(expected, actual, rtol=1e-5, atol=1e-8)
 
 
-def evaluate_instance(
-    subscripts: str,
-    shapes: list[tuple[int, ...]],
-    timeout_s: float,
-    rng: np.random.Generator,
-) -> dict[str, Any]:
-    """Evaluate a single instance.
+def prepare_instance(level_idx: int, instance_idx: int) -> dict[str, Any]:
+    """Generate one seeded instance of a level, compute its path and verify it.
 
-    Measures two things:
-    1. Correctness: Does the path produce the right result? (using small tensors)
-    2. Performance: How fast does einsum execute with this path? (using actual sizes)
+    This is the untimed part of an instance, so instances of a level can be
+    prepared in parallel worker processes. The instance's own generator also
+    supplies its tensor data; its state after verification is returned so the
+    timed run draws the same tensors regardless of which worker prepared it.
     """
+    level = LEVELS[level_idx]
+
+    # Seed for this specific instance (reproducible)
+    instance_seed = SEED + level_idx * 1000 + instance_idx
+    rng = np.random.default_rng(instance_seed)
+
+    num_tensors = int(rng.integers(level["tensors"][0], level["tensors"][1] + 1))
+    subscripts, shapes = generate_instance(rng, num_tensors)
+
     result = {
         "subscripts": subscripts,
         "shapes": [list(s) for s in shapes],
@@ -178,35 +294,69 @@ def evaluate_instance(
         "time_s": None,
         "error": None,
     }
+    prepared = {"result": result, "path": None, "rng_state": None, "elapsed_s": 0.0}
 
+    start = time.perf_counter()
     try:
-        with timeout(timeout_s):
+        with timeout(level["timeout"]):
             # Step 1: Compute the path
             path = optimize_einsum(subscripts, *shapes)
 
             # Step 2: Verify correctness (fast, using small tensors)
             if not verify_correctness(subscripts, shapes, path, rng):
                 result["error"] = "incorrect result"
-                return result
+                return prepared
+    except TimeoutError as e:
+        result["error"] = str(e)
+        return prepared
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return prepared
+
+    prepared["path"] = path
+    prepared["rng_state"] = rng.bit_generator.state
+    prepared["elapsed_s"] = time.perf_counter() - start
+    return prepared
+
 
-            # Step 3: Measure execution time with actual tensor sizes
+def time_instance(prepared: dict[str, Any], timeout_s: float) -> dict[str, Any]:
+    """Measure how fast a prepared instance contracts along its path.
+
+    Runs in the calling process, one instance at a time, so timings are not
+    skewed by other instances competing for cores and memory bandwidth. The
+    timeout covers the whole instance, so preparation time counts against it.
+    """
+    result = prepared["result"]
+    if result["error"] is not None:
+        return result
+
+    subscripts = result["subscripts"]
+    shapes = [tuple(s) for s in result["shapes"]]
+    rng = np.random.default_rng()
+    rng.bit_generator.state = prepared["rng_state"]
+
+    try:
+        with timeout(max(timeout_s - prepared["elapsed_s"], 1e-3)):
+            # Step 3: Measure execution time with actual tensor sizes. The path
+            # is compiled once so the timed runs only run the contractions.
+            contract = compile_contraction(subscripts, prepared["path"])
             tensors = [rng.random(shape) for shape in shapes]
 
             # Warm up
-            _ = np.einsum(subscripts, *tensors, optimize=path)
+            _ = contract(*tensors)
 
             # Timed run (average of 3)
             times = []
             for _ in range(3):
                 start = time.perf_counter()
-                _ = np.einsum(subscripts, *tensors, optimize=path)
+                _ = contract(*tensors)
                 times.append(time.perf_counter() - start)
 
             result["time_s"] = sum(times) / len(times)
             result["passed"] = True
 
-    except TimeoutError as e:
-        result["error"] = str(e)
+    except TimeoutError:
+        result["error"] = f"Timed out after {timeout_s}s"
     except Exception as e:
         result["error"] = f"{type(e).__name__}: {e}"
 
@@ -215,8 +365,11 @@ def evaluate_instance(
 
 def evaluate() -> dict[str, Any]:
     """Run full evaluation."""
-    rng = np.random.default_rng(SEED)
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return _evaluate_levels(executor)
+
 
+def _evaluate_levels(executor: ProcessPoolExecutor) -> dict[str, Any]:
     results = {
         "levels_passed": 0,
         "total_levels": len(LEVELS),
@@ -237,25 +390,25 @@ def evaluate() -> dict[str, Any]:
         all_passed = True
         total_time = 0.0
 
-        # Generate and evaluate instances for this level
-        for instance_idx in range(INSTANCES_PER_LEVEL):
-            # Seed for this specific instance (reproducible)
-            instance_seed = SEED + level_idx * 1000 + instance_idx
-            instance_rng = np.random.default_rng(instance_seed)
-
-            num_tensors = int(instance_rng.integers(level["tensors"][0], level["tensors"][1] + 1))
-            subscripts, shapes = generate_instance(instance_rng, num_tensors)
-
-            instance_result = evaluate_instance(
-                subscripts, shapes, level["timeout"], rng
-            )
-            level_result["instances"].append(instance_result)
-
-            if instance_result["passed"]:
-                total_time += instance_result["time_s"]
-            else:
-                all_passed = False
-                break  # Stop at first failure in level
+        # Prepare the level's instances in parallel, then time them one at a
+        # time in order in this process
+        futures = [
+            executor.submit(prepare_instance, level_idx, instance_idx)
+            for instance_idx in range(INSTANCES_PER_LEVEL)
+        ]
+        try:
+            for future in futures:
+                instance_result = time_instance(future.result(), level["timeout"])
+                level_result["instances"].append(instance_result)
+
+                if instance_result["passed"]:
+                    total_time += instance_result["time_s"]
+                else:
+                    all_passed = False
+                    break  # Stop at first failure in level
+        finally:
+            for future in futures:
+                future.cancel()
 
         level_result["passed"] = all_passed
         level_result["total_time"] = total_time
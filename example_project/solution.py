@@ -1,10 +1,22 @@
 """Einsum contraction order optimizer.
 
-Baseline implementation using a simple greedy heuristic.
+Networks of up to ``OPTIMAL_MAX_TENSORS`` tensors get a FLOP-optimal path
+from a dynamic program over subsets. Larger chains and rings of tensors are
+swept end to end, and everything else uses a greedy heuristic over pairwise
+contractions. Intermediate tensors keep only the indices still needed by the
+output or by another remaining tensor, the same rule opt_einsum uses when it
+builds contraction paths.
 """
 
 from __future__ import annotations
 
+import heapq
+import math
+from collections.abc import Iterator
+
+# Largest network searched exhaustively; beyond this the greedy is used
+OPTIMAL_MAX_TENSORS = 8
+
 
 def optimize_einsum(subscripts: str, *shapes: tuple[int, ...]) -> list:
     """Find an efficient contraction order for einsum.
@@ -41,122 +53,342 @@ def optimize_einsum(subscripts: str, *shapes: tuple[int, ...]) -> list:
             else:
                 index_dims[idx] = dim
 
-    # Track current tensors: list of (subscripts, shape)
-    tensors: list[tuple[str, tuple[int, ...]]] = list(zip(input_subs, shapes))
-    path: list[tuple[int, int]] = []
+    # With one or two tensors there is nothing to choose (a lone tensor still
+    # needs its (0,) step so numpy applies any transpose or trace)
+    if len(input_subs) == 1:
+        return ["einsum_path", (0,)]
+    if len(input_subs) == 2:
+        return ["einsum_path", (0, 1)]
 
-    # Greedy: repeatedly contract the pair with smallest intermediate size
-    while len(tensors) > 1:
-        best_pair = None
-        best_cost = float("inf")
+    output_indices = set(output_str) if output_str is not None else _implicit_output(input_subs)
 
-        for i in range(len(tensors)):
-            for j in range(i + 1, len(tensors)):
-                cost = _contraction_cost(tensors[i], tensors[j], index_dims, output_str)
-                if cost < best_cost:
-                    best_cost = cost
-                    best_pair = (i, j)
+    # Small networks can afford an exhaustive search
+    if len(input_subs) <= OPTIMAL_MAX_TENSORS:
+        return ["einsum_path"] + _optimal_path(input_subs, index_dims, output_indices)
 
-        i, j = best_pair
-        path.append((i, j))
+    # Larger tensor trains (chains and rings such as MPS products) are
+    # contracted by sweeping from one end, so no search is needed
+    chain = _chain_order(input_subs)
+    if chain is not None:
+        return ["einsum_path"] + _sweep_path(chain)
 
-        # Contract tensors i and j
-        new_tensor = _contract(tensors[i], tensors[j], output_str)
+    return ["einsum_path"] + _greedy_path(input_subs, index_dims, output_indices)
 
-        # Remove j first (higher index), then i
-        tensors.pop(j)
-        tensors.pop(i)
-        tensors.append(new_tensor)
 
-    return ["einsum_path"] + path
+def _optimal_path(
+    input_subs: list[str],
+    index_dims: dict[str, int],
+    output_indices: set[str],
+) -> list[tuple[int, int]]:
+    """FLOP-optimal contraction path by dynamic programming over subsets.
 
+    ``best[S]`` holds the cheapest way to contract the set of tensors ``S``
+    (a bitmask over tensor positions) into one intermediate, built from the
+    best splits of ``S`` into two disjoint halves. This is O(3^N).
+    """
+    bit = {idx: 1 << k for k, idx in enumerate(index_dims)}
+    dims = list(index_dims.values())
+    output_mask = _mask(output_indices, bit)
+
+    n = len(input_subs)
+    full = (1 << n) - 1
+    tensor_masks = [_mask(subs, bit) for subs in input_subs]
+
+    # Indices carried by each subset of tensors
+    subset_indices = [0] * (full + 1)
+    for subset in range(1, full + 1):
+        low = subset & -subset
+        subset_indices[subset] = subset_indices[subset ^ low] | tensor_masks[low.bit_length() - 1]
+
+    # Indices on the tensor representing each subset: inputs keep all of
+    # theirs, intermediates only those needed by the output or the rest
+    operand_indices = [
+        subset_indices[subset] & (output_mask | subset_indices[full ^ subset])
+        for subset in range(full + 1)
+    ]
+    for k, mask in enumerate(tensor_masks):
+        operand_indices[1 << k] = mask
+
+    sizes: dict[int, int] = {}
+    best_cost = [0] * (full + 1)
+    best_split = [0] * (full + 1)
+    for subset in sorted(range(1, full + 1), key=int.bit_count):
+        if subset & (subset - 1) == 0:
+            continue  # single input tensor, nothing to contract
+        low = subset & -subset
+        rest = subset ^ low
+        cost = None
+        # Enumerate halves containing the lowest tensor so each split is seen once
+        part = rest
+        while True:
+            left = part | low
+            right = subset ^ left
+            if right:
+                touched = operand_indices[left] | operand_indices[right]
+                flops = sizes.get(touched)
+                if flops is None:
+                    flops = sizes[touched] = _mask_size(touched, dims)
+                total = best_cost[left] + best_cost[right] + flops
+                if cost is None or total < cost:
+                    cost = total
+                    best_split[subset] = left
+            if part == 0:
+                break
+            part = (part - 1) & rest
+        best_cost[subset] = cost
+
+    # Replay the best splits children-first, tracking numpy's operand list
+    order = [1 << k for k in range(n)]
+    path: list[tuple[int, int]] = []
 
-def _contraction_cost(
-    t1: tuple[str, tuple[int, ...]],
-    t2: tuple[str, tuple[int, ...]],
+    def emit(subset: int) -> None:
+        if subset & (subset - 1) == 0:
+            return
+        left = best_split[subset]
+        right = subset ^ left
+        emit(left)
+        emit(right)
+        pos_left = order.index(left)
+        pos_right = order.index(right)
+        path.append((min(pos_left, pos_right), max(pos_left, pos_right)))
+        order.remove(left)
+        order.remove(right)
+        order.append(subset)
+
+    emit(full)
+    return path
+
+
+def _greedy_path(
+    input_subs: list[str],
     index_dims: dict[str, int],
-    output_str: str | None,
-) -> int:
-    """Estimate cost of contracting two tensors.
+    output_indices: set[str],
+) -> list[tuple[int, int]]:
+    """Greedy contraction path over index-set bitmasks."""
+    # Number the indices so index sets become integer bitmasks: unions and
+    # intersections are then single integer operations
+    bit = {idx: 1 << k for k, idx in enumerate(index_dims)}
+    dims = list(index_dims.values())
+    output_mask = _mask(output_indices, bit)
+
+    # Number of remaining tensors that carry each index. An index survives a
+    # contraction only if the output or some other remaining tensor needs it.
+    index_refs = [0] * len(dims)
+    for subs in input_subs:
+        for k in _bit_positions(_mask(subs, bit)):
+            index_refs[k] += 1
+    keep = _keep_masks(output_mask, index_refs)
+
+    # Track current tensors by id; ``order`` mirrors numpy's operand list,
+    # where each contraction removes its pair and appends the result.
+    tensors: dict[int, _Tensor] = {}
+    for k, subs in enumerate(input_subs):
+        mask = _mask(subs, bit)
+        tensors[k] = _Tensor(mask, _mask_size(mask, dims))
+    order = list(tensors)
+    next_id = len(order)
+    path: list[tuple[int, int]] = []
 
-    Uses size of resulting intermediate tensor as cost metric.
+    # Pair costs only depend on the two tensors and on which of their indices
+    # are needed elsewhere, which other contractions never change. Entries for
+    # consumed tensors are skipped lazily when popped.
+    heap = [
+        (_contraction_cost(tensors[i], tensors[j], dims, keep), i, j)
+        for i in order
+        for j in order[i + 1 :]
+    ]
+    heapq.heapify(heap)
+
+    # Greedy: repeatedly contract the pair that shrinks the network the most
+    while len(tensors) > 1:
+        _, i, j = heapq.heappop(heap)
+        if i not in tensors or j not in tensors:
+            continue
+
+        pos_i = order.index(i)
+        pos_j = order.index(j)
+        path.append((min(pos_i, pos_j), max(pos_i, pos_j)))
+
+        # Contract tensors i and j
+        new_tensor = _contract(tensors[i], tensors[j], dims, keep)
+
+        # The pair is consumed and the intermediate takes their place
+        mask1 = tensors.pop(i).mask
+        mask2 = tensors.pop(j).mask
+        for k in _bit_positions(mask1):
+            index_refs[k] -= 1
+        for k in _bit_positions(mask2):
+            index_refs[k] -= 1
+        for k in _bit_positions(new_tensor.mask):
+            index_refs[k] += 1
+        keep = _keep_masks(output_mask, index_refs)
+
+        order.remove(i)
+        order.remove(j)
+        for k in order:
+            cost = _contraction_cost(tensors[k], new_tensor, dims, keep)
+            heapq.heappush(heap, (cost, k, next_id))
+        tensors[next_id] = new_tensor
+        order.append(next_id)
+        next_id += 1
+
+    return path
+
+
+def _chain_order(input_subs: list[str]) -> list[int] | None:
+    """Order tensors along a chain or ring, or return None for other networks.
+
+    A network qualifies when every tensor has rank <= 3, every index is shared
+    by at most two tensors, and the tensors' adjacency graph is a single path
+    or cycle.
     """
-    subs1, _ = t1
-    subs2, _ = t2
+    n = len(input_subs)
+    if any(len(subs) > 3 for subs in input_subs):
+        return None
+
+    index_to_tensors: dict[str, list[int]] = {}
+    for k, subs in enumerate(input_subs):
+        for idx in set(subs):
+            index_to_tensors.setdefault(idx, []).append(k)
+
+    neighbours: list[set[int]] = [set() for _ in range(n)]
+    for owners in index_to_tensors.values():
+        if len(owners) > 2:
+            return None
+        if len(owners) == 2:
+            a, b = owners
+            neighbours[a].add(b)
+            neighbours[b].add(a)
+
+    if any(len(adj) > 2 for adj in neighbours):
+        return None
+
+    # Walk from an end of the chain (or from tensor 0 for a ring)
+    ends = [k for k in range(n) if len(neighbours[k]) < 2]
+    start = ends[0] if ends else 0
+    chain = [start]
+    visited = {start}
+    while len(chain) < n:
+        unvisited = neighbours[chain[-1]] - visited
+        if not unvisited:
+            return None  # disconnected
+        nxt = min(unvisited)
+        chain.append(nxt)
+        visited.add(nxt)
+    return chain
+
+
+def _sweep_path(chain: list[int]) -> list[tuple[int, int]]:
+    """Path that contracts tensors one by one in ``chain`` order."""
+    order = list(range(len(chain)))
+    path: list[tuple[int, int]] = []
+    acc = chain[0]
+    for k in chain[1:]:
+        pos_a = order.index(acc)
+        pos_b = order.index(k)
+        path.append((min(pos_a, pos_b), max(pos_a, pos_b)))
+        order.remove(acc)
+        order.remove(k)
+        acc = -len(path)  # ids of intermediates never clash with inputs
+        order.append(acc)
+    return path
 
-    # Indices in the result of this contraction
-    all_indices = set(subs1) | set(subs2)
 
-    # Indices that will be summed out (appear in both but not in final output)
-    contracted = set(subs1) & set(subs2)
+class _Tensor:
+    """A tensor in the greedy search: its index bitmask and number of elements."""
 
-    # Keep indices that appear in output or might be needed later
-    if output_str:
-        # Keep indices in final output
-        result_indices = all_indices & set(output_str)
-        # Also keep indices that only appear in one tensor (might connect to others)
-        result_indices |= (set(subs1) - set(subs2)) | (set(subs2) - set(subs1))
-    else:
-        # No explicit output - keep non-contracted indices
-        result_indices = all_indices - contracted
+    __slots__ = ("mask", "size")
 
-    # Calculate size of intermediate tensor
-    size = 1
-    for idx in result_indices:
-        size *= index_dims[idx]
+    def __init__(self, mask: int, size: int) -> None:
+        self.mask = mask
+        self.size = size
 
-    # Add FLOP cost (multiply-adds for contraction)
-    flops = size
-    for idx in contracted:
-        flops *= index_dims[idx]
 
-    # Weight by both intermediate size and FLOP count
-    return size + flops
+def _mask(indices: str | set[str], bit: dict[str, int]) -> int:
+    """Bitmask of a collection of indices."""
+    mask = 0
+    for idx in indices:
+        mask |= bit[idx]
+    return mask
 
 
-def _contract(
-    t1: tuple[str, tuple[int, ...]],
-    t2: tuple[str, tuple[int, ...]],
-    output_str: str | None,
-) -> tuple[str, tuple[int, ...]]:
-    """Compute the result of contracting two tensors.
+def _bit_positions(mask: int) -> Iterator[int]:
+    """Positions of the set bits of ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _mask_size(mask: int, dims: list[int]) -> int:
+    """Number of elements of a tensor over the indices in ``mask``."""
+    return math.prod(dims[k] for k in _bit_positions(mask))
+
 
-    Returns the subscripts and shape of the resulting tensor.
+def _implicit_output(input_subs: list[str]) -> set[str]:
+    """Output indices of an implicit-mode expression (those appearing once)."""
+    counts: dict[str, int] = {}
+    for subs in input_subs:
+        for idx in subs:
+            counts[idx] = counts.get(idx, 0) + 1
+    return {idx for idx, count in counts.items() if count == 1}
+
+
+def _keep_masks(output_mask: int, index_refs: list[int]) -> tuple[int, int, int]:
+    """Masks deciding which indices survive a pairwise contraction.
+
+    Returns the output mask plus the indices carried by at least two and at
+    least three remaining tensors.
     """
-    subs1, shape1 = t1
-    subs2, shape2 = t2
-
-    # Build dimension map for these tensors
-    dims: dict[str, int] = {}
-    for idx, dim in zip(subs1, shape1):
-        dims[idx] = dim
-    for idx, dim in zip(subs2, shape2):
-        dims[idx] = dim
-
-    # Result keeps indices from either tensor that:
-    # 1. Appear in only one tensor (external), or
-    # 2. Appear in the final output
-    all_indices = set(subs1) | set(subs2)
-    contracted = set(subs1) & set(subs2)
-
-    if output_str:
-        # Keep indices in final output plus external indices
-        external = (set(subs1) - set(subs2)) | (set(subs2) - set(subs1))
-        result_indices = (all_indices & set(output_str)) | external
-    else:
-        result_indices = all_indices - contracted
-
-    # Maintain a consistent order for result indices
-    result_subs = "".join(idx for idx in (subs1 + subs2) if idx in result_indices)
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_subs = ""
-    for c in result_subs:
-        if c not in seen:
-            seen.add(c)
-            unique_subs += c
-    result_subs = unique_subs
-
-    result_shape = tuple(dims[idx] for idx in result_subs)
-
-    return (result_subs, result_shape)
+    shared = 0
+    shared3 = 0
+    for k, refs in enumerate(index_refs):
+        if refs >= 2:
+            shared |= 1 << k
+            if refs >= 3:
+                shared3 |= 1 << k
+    return (output_mask, shared, shared3)
+
+
+def _result_mask(mask1: int, mask2: int, keep: tuple[int, int, int]) -> int:
+    """Indices kept on the intermediate produced by contracting two tensors.
+
+    An index is kept if it appears in the final output or in any remaining
+    tensor other than the two being contracted; everything else is summed out.
+    """
+    output_mask, shared, shared3 = keep
+    return (mask1 | mask2) & (output_mask | (shared & (mask1 ^ mask2)) | (shared3 & mask1 & mask2))
+
+
+def _contraction_cost(
+    t1: _Tensor,
+    t2: _Tensor,
+    dims: list[int],
+    keep: tuple[int, int, int],
+) -> tuple[int, int]:
+    """Estimate cost of contracting two tensors.
+
+    Uses the "removed size" metric of opt_einsum's greedy: the size of the
+    intermediate minus the sizes of both inputs, so contractions that shrink
+    the network are preferred. Ties are broken by FLOP count.
+    """
+    result = _result_mask(t1.mask, t2.mask, keep)
+
+    # Size of the intermediate tensor
+    size = _mask_size(result, dims)
+
+    # FLOP cost (multiply-adds over every index touched by the contraction)
+    flops = size * _mask_size((t1.mask | t2.mask) & ~result, dims)
+
+    return (size - t1.size - t2.size, flops)
+
+
+def _contract(
+    t1: _Tensor,
+    t2: _Tensor,
+    dims: list[int],
+    keep: tuple[int, int, int],
+) -> _Tensor:
+    """Compute the result of contracting two tensors."""
+    result = _result_mask(t1.mask, t2.mask, keep)
+    return _Tensor(result, _mask_size(result, dims))
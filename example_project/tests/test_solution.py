@@ -76,6 +76,15 @@ class TestOptimizeEinsum:
         actual = np.einsum(subscripts, *tensors, optimize=path)
         assert np.allclose(expected, actual)
 
+    def test_single_tensor(self):
+        """Test that a single tensor gets numpy's one-operand path."""
+        path = optimize_einsum("ij->ji", (10, 20))
+
+        assert path == ["einsum_path", (0,)]
+
+        tensor = np.random.rand(10, 20)
+        assert np.allclose(np.einsum("ij->ji", tensor, optimize=path), tensor.T)
+
     def test_shape_mismatch_raises(self):
         """Test that mismatched shapes raise an error."""
         subscripts = "ij,jk->ik"
@@ -107,6 +116,32 @@ class TestOptimizeEinsum:
         actual = np.einsum(subscripts, *tensors, optimize=path)
         assert np.allclose(expected, actual)
 
+    def test_ring_is_swept_in_order(self):
+        """Test that a large ring of tensors is contracted by a sweep along the ring."""
+        labels = "abcdefghij"
+        subscripts = ",".join(a + b for a, b in zip(labels, labels[1:] + labels[0])) + "->"
+        shapes = [(3, 3)] * len(labels)
+
+        path = optimize_einsum(subscripts, *shapes)
+
+        n = len(labels)
+        assert path == ["einsum_path", (0, 1)] + [(0, n - 1 - step) for step in range(1, n - 1)]
+
+        tensors = [np.random.rand(*s) for s in shapes]
+        expected = np.einsum(subscripts, *tensors, optimize=True)
+        actual = np.einsum(subscripts, *tensors, optimize=path)
+        assert np.allclose(expected, actual)
+
+    def test_small_network_uses_optimal_path(self):
+        """Test that small networks get the FLOP-optimal order, not a left-to-right sweep."""
+        subscripts = "ij,jk,kl->il"
+        shapes = [(100, 2), (2, 100), (100, 2)]
+
+        path = optimize_einsum(subscripts, *shapes)
+
+        # Contracting the last two first keeps every intermediate at 2x2
+        assert path == ["einsum_path", (1, 2), (0, 1)]
+
     def test_no_output_indices(self):
         """Test contraction to scalar."""
         subscripts = "ij,ji"  # No -> means contract everything
@@ -149,3 +184,15 @@ class TestEvaluateScript:
         assert "levels_passed" in results
         assert results["levels_passed"] >= 0
         assert results["score"] >= 0
+
+    def test_compile_contraction_matches_einsum(self):
+        """Test that a compiled path reproduces numpy's einsum result."""
+        from evaluate import compile_contraction
+
+        subscripts = "ij,jk,kl->il"
+        shapes = [(3, 4), (4, 5), (5, 6)]
+        tensors = [np.random.rand(*s) for s in shapes]
+
+        contract = compile_contraction(subscripts, ["einsum_path", (1, 2), (0, 1)])
+
+        assert np.allclose(contract(*tensors), np.einsum(subscripts, *tensors))
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import os
+import re
+import shlex
 import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
-from aurelia.cli.wizard_prompts import (
-    get_evaluate_prompt,
-    get_readme_prompt,
-    get_solution_prompt,
-)
+# Characters dropped from the directory name when deriving the project name:
+# anything that isn't alphanumeric or a dash
+_PROJECT_NAME_STRIP = re.compile(r"[^\w-]|_")
+
+# Absolute paths of the required tools, filled in by _check_prerequisites so
+# later spawns can skip the PATH search
+_TOOLS: dict[str, str] = {}
 
 
 def run_init() -> None:
@@ -42,9 +46,7 @@ def run_init() -> None:
     _setup_solution(project_dir)
 
     # Step 5: Project configuration
-    _setup_pixi_config(project_dir)
-    _setup_pyproject(project_dir)
-    _setup_tests_dir(project_dir)
+    _setup_project_files(project_dir)
     _setup_aurelia_config(project_dir)
 
     # Step 6: Git
@@ -76,11 +78,16 @@ def _check_prerequisites() -> bool:
         ("pixi", "Pixi", "https://pixi.sh"),
     ]
 
+    # Each lookup walks PATH independently, so probe all tools at once
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        found = list(executor.map(shutil.which, [cmd for cmd, _, _ in tools]))
+
     missing = []
-    for cmd, name, install_hint in tools:
-        if shutil.which(cmd) is None:
+    for (cmd, name, install_hint), path in zip(tools, found):
+        if path is None:
             missing.append((name, install_hint))
         else:
+            _TOOLS[cmd] = path
             click.echo(f"    {click.style('OK', fg='green')} {name}")
 
     if missing:
@@ -147,7 +154,7 @@ def _setup_readme(project_dir: Path) -> None:
 
     readme_path = project_dir / "README.md"
 
-    if readme_path.exists():
+    if os.path.lexists(readme_path):
         click.echo("    README.md already exists. Skipping.")
         click.echo("")
         return
@@ -202,13 +209,13 @@ def _setup_evaluate(project_dir: Path) -> None:
 
     eval_path = project_dir / "evaluate.py"
 
-    if eval_path.exists():
+    if os.path.lexists(eval_path):
         click.echo("    evaluate.py already exists. Skipping.")
         click.echo("")
         return
 
     readme_path = project_dir / "README.md"
-    if not readme_path.exists():
+    if not os.path.lexists(readme_path):
         click.echo("    Warning: README.md not found. Creating evaluate.py may be difficult.")
 
     click.echo("    evaluate.py measures solution quality with numeric metrics.")
@@ -256,14 +263,14 @@ def _setup_solution(project_dir: Path) -> None:
 
     solution_path = project_dir / "solution.py"
 
-    if solution_path.exists():
+    if os.path.lexists(solution_path):
         click.echo("    solution.py already exists. Skipping.")
         click.echo("")
         return
 
     readme_path = project_dir / "README.md"
     eval_path = project_dir / "evaluate.py"
-    if not readme_path.exists() or not eval_path.exists():
+    if not os.path.lexists(readme_path) or not os.path.lexists(eval_path):
         click.echo("    Warning: README.md or evaluate.py not found.")
         click.echo("    Creating solution.py may be difficult without them.")
 
@@ -301,19 +308,8 @@ def _setup_solution(project_dir: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _setup_pixi_config(project_dir: Path) -> None:
-    """Create pixi.toml with standard tasks."""
-    pixi_path = project_dir / "pixi.toml"
-
-    if pixi_path.exists():
-        return
-
-    # Sanitize project name
-    project_name = project_dir.name.replace(" ", "-").lower()
-    project_name = "".join(c for c in project_name if c.isalnum() or c == "-")
-
-    content = f'''[workspace]
-name = "{project_name}"
+_PIXI_TEMPLATE = """[workspace]
+name = "{name}"
 channels = ["conda-forge"]
 platforms = ["osx-arm64", "osx-64", "linux-64"]
 
@@ -327,24 +323,10 @@ test = "pytest tests/"
 evaluate = "python evaluate.py"
 lint = "ruff check ."
 fmt = "ruff format ."
-'''
-
-    pixi_path.write_text(content)
-    click.echo("    Created pixi.toml")
-
-
-def _setup_pyproject(project_dir: Path) -> None:
-    """Create pyproject.toml for Python tooling."""
-    pyproject_path = project_dir / "pyproject.toml"
-
-    if pyproject_path.exists():
-        return
-
-    project_name = project_dir.name.replace(" ", "-").lower()
-    project_name = "".join(c for c in project_name if c.isalnum() or c == "-")
+"""
 
-    content = f'''[project]
-name = "{project_name}"
+_PYPROJECT_TEMPLATE = """[project]
+name = "{name}"
 version = "0.1.0"
 requires-python = ">=3.12"
 
@@ -353,20 +335,31 @@ line-length = 100
 
 [tool.pytest.ini_options]
 testpaths = ["tests"]
-'''
+"""
 
-    pyproject_path.write_text(content)
-    click.echo("    Created pyproject.toml")
+_WORKFLOW_YAML = """runtime:
+  max_concurrent_tasks: 4
+  heartbeat_interval_s: 60
+  candidate_abandon_threshold: 5
+"""
+
+_COMPONENTS_YAML = "components: []\n"
 
 
-def _setup_tests_dir(project_dir: Path) -> None:
-    """Ensure tests directory exists."""
-    tests_dir = project_dir / "tests"
-    tests_dir.mkdir(exist_ok=True)
+def _setup_project_files(project_dir: Path) -> None:
+    """Create pixi.toml, pyproject.toml and the tests package if missing."""
+    # Sanitize project name
+    project_name = _PROJECT_NAME_STRIP.sub("", project_dir.name.replace(" ", "-").lower())
 
-    init_file = tests_dir / "__init__.py"
-    if not init_file.exists():
-        init_file.write_text("")
+    manifest = {
+        "pixi.toml": _PIXI_TEMPLATE.format(name=project_name),
+        "pyproject.toml": _PYPROJECT_TEMPLATE.format(name=project_name),
+        "tests/__init__.py": "",
+    }
+
+    for relpath in _materialize(project_dir, manifest):
+        if "/" not in relpath:
+            click.echo(f"    Created {relpath}")
 
 
 def _setup_aurelia_config(project_dir: Path) -> None:
@@ -374,32 +367,29 @@ def _setup_aurelia_config(project_dir: Path) -> None:
     click.echo(click.style("  Step 5: Aurelia Configuration", bold=True))
 
     aurelia_dir = project_dir / ".aurelia"
+    aurelia_dir.mkdir(parents=True, exist_ok=True)
     for subdir in ["state", "logs", "cache", "reports", "config"]:
-        (aurelia_dir / subdir).mkdir(parents=True, exist_ok=True)
-
-    # Write workflow config
-    workflow_cfg = aurelia_dir / "config" / "workflow.yaml"
-    if not workflow_cfg.exists():
-        content = """runtime:
-  max_concurrent_tasks: 4
-  heartbeat_interval_s: 60
-  candidate_abandon_threshold: 5
-"""
-        workflow_cfg.write_text(content)
-
-    # Write components config
-    components_cfg = aurelia_dir / "config" / "components.yaml"
-    if not components_cfg.exists():
-        components_cfg.write_text("components: []\n")
+        (aurelia_dir / subdir).mkdir(exist_ok=True)
+
+    # Write workflow and components config
+    _materialize(
+        aurelia_dir,
+        {
+            "config/workflow.yaml": _WORKFLOW_YAML,
+            "config/components.yaml": _COMPONENTS_YAML,
+        },
+    )
 
     # Update .gitignore
     gitignore = project_dir / ".gitignore"
-    gitignore_content = gitignore.read_text() if gitignore.exists() else ""
+    try:
+        gitignore_content = gitignore.read_text()
+    except FileNotFoundError:
+        gitignore_content = ""
     if ".aurelia/" not in gitignore_content:
-        with open(gitignore, "a") as f:
-            if gitignore_content and not gitignore_content.endswith("\n"):
-                f.write("\n")
-            f.write("\n# Aurelia runtime state\n.aurelia/\n")
+        if gitignore_content and not gitignore_content.endswith("\n"):
+            gitignore_content += "\n"
+        gitignore.write_text(gitignore_content + "\n# Aurelia runtime state\n.aurelia/\n")
 
     click.echo("    Created .aurelia/ directory structure")
     click.echo("")
@@ -415,30 +405,42 @@ def _ensure_git_repo(project_dir: Path) -> None:
     click.echo(click.style("  Step 6: Git Repository", bold=True))
 
     git_dir = project_dir / ".git"
-    if git_dir.exists():
+    # .git may be a file (worktrees, submodules), so don't insist on a directory
+    if os.path.lexists(git_dir):
         click.echo("    Git repository already exists.")
         click.echo("")
         return
 
+    import subprocess
+
     click.echo("    Initializing git repository...")
-    subprocess.run(
-        ["git", "init", "-b", "main"],
-        cwd=project_dir,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "add", "."],
-        cwd=project_dir,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=project_dir,
-        check=True,
-        capture_output=True,
-    )
+    # Pass the directory via -C rather than cwd: with no cwd and
+    # close_fds=False subprocess can use posix_spawn instead of fork + exec
+    git = [_TOOLS.get("git", "git"), "-C", str(project_dir)]
+    commands = [
+        [*git, "init", "-b", "main"],
+        [*git, "add", "."],
+        [*git, "commit", "-m", "Initial commit"],
+    ]
+    sh = shutil.which("sh")
+    if sh is not None:
+        # One spawn from Python for the whole sequence; stops at the first failure
+        subprocess.run(
+            [sh, "-c", " && ".join(shlex.join(cmd) for cmd in commands)],
+            check=True,
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        for cmd in commands:
+            subprocess.run(
+                cmd,
+                check=True,
+                close_fds=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     click.echo("    Created git repository with initial commit.")
     click.echo("")
 
@@ -448,17 +450,53 @@ def _ensure_git_repo(project_dir: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _materialize(root: Path, manifest: dict[str, str]) -> list[str]:
+    """Write each manifest entry that doesn't exist yet under root.
+
+    Every target directory is listed once with os.scandir rather than
+    stat-ing each file, and created if it is missing. Returns the relative
+    paths that were written, in manifest order.
+    """
+    existing: dict[Path, set[str]] = {}
+    written = []
+    for relpath, content in manifest.items():
+        path = root / relpath
+        names = existing.get(path.parent)
+        if names is None:
+            try:
+                with os.scandir(path.parent) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                path.parent.mkdir(parents=True)
+                names = set()
+            existing[path.parent] = names
+        if path.name not in names:
+            path.write_text(content)
+            names.add(path.name)
+            written.append(relpath)
+    return written
+
+
 def _open_editor(path: Path, default_content: str = "") -> None:
     """Open file in user's editor."""
+    import subprocess
+
     editor = os.environ.get("EDITOR", "nano")
 
-    if not path.exists():
+    if not os.path.lexists(path):
         path.write_text(default_content)
 
     click.echo(f"    Opening {path.name} in {editor}...")
-    subprocess.run([editor, str(path)])
+    result = subprocess.run([editor, str(path)])
+    if result.returncode != 0:
+        click.echo(f"    Editor exited with code {result.returncode}")
+        return
 
-    if path.exists() and path.stat().st_size > 0:
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        size = 0
+    if size > 0:
         click.echo(f"    {path.name} saved.")
     else:
         click.echo(f"    Warning: {path.name} is empty or missing.")
@@ -470,6 +508,14 @@ def _run_gemini_interactive(
     context: str,
 ) -> None:
     """Launch interactive Gemini CLI session for guided file creation."""
+    import subprocess
+
+    from aurelia.cli.wizard_prompts import (
+        get_evaluate_prompt,
+        get_readme_prompt,
+        get_solution_prompt,
+    )
+
     # Get the appropriate prompt
     if task == "readme":
         prompt = get_readme_prompt(context)
@@ -496,7 +542,7 @@ def _run_gemini_interactive(
 
         # Run Gemini CLI interactively (no -y flag)
         result = subprocess.run(
-            ["gemini"],
+            [_TOOLS.get("gemini", "gemini")],
             cwd=project_dir,
             env=env,
         )
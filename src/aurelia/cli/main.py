@@ -6,6 +6,9 @@ from pathlib import Path
 
 import click
 
+# Branch names passed to a single `git branch -D` invocation
+_BRANCH_DELETE_BATCH = 500
+
 
 @click.group()
 @click.version_option(package_name="aurelia")
@@ -53,7 +56,8 @@ def start(
 
     configure_logging(json_output=json_logs)
 
-    project_dir = project_dir.resolve()
+    # Resolve to absolute path to avoid path duplication in git operations
+    project_dir = _absolute(project_dir)
 
     # Reset state if requested
     if reset:
@@ -65,15 +69,20 @@ def start(
 
         start_metrics_server(metrics_port)
 
-    # Resolve to absolute path to avoid path duplication in git operations
     runtime = Runtime(project_dir=project_dir, use_mock=mock)
-    asyncio.run(runtime.start())
+    try:
+        import uvloop
+    except ImportError:  # optional speedup; fall back to the stock event loop
+        asyncio.run(runtime.start())
+    else:
+        # Faster subprocess pipes for evaluator and presubmit output
+        uvloop.run(runtime.start())
 
 
 @cli.command()
 @click.option(
     "--project-dir",
-    type=click.Path(exists=True, path_type=Path),
+    type=Path,
     default=Path.cwd,
     help="Project root directory.",
 )
@@ -82,13 +91,14 @@ def stop(project_dir: Path) -> None:
     import os
     import signal
 
-    project_dir = project_dir.resolve()
+    project_dir = _absolute(project_dir)
     pid_file = project_dir / ".aurelia" / "state" / "pid"
-    if not pid_file.exists():
+    try:
+        pid = int(pid_file.read_text().strip())
+    except FileNotFoundError:
         click.echo("No PID file found — is the runtime running?")
         raise SystemExit(1)
 
-    pid = int(pid_file.read_text().strip())
     try:
         os.kill(pid, signal.SIGTERM)
     except ProcessLookupError:
@@ -102,26 +112,27 @@ def stop(project_dir: Path) -> None:
 @cli.command()
 @click.option(
     "--project-dir",
-    type=click.Path(exists=True, path_type=Path),
+    type=Path,
     default=Path.cwd,
     help="Project root directory.",
 )
 def status(project_dir: Path) -> None:
     """Show runtime status."""
     import json
+    import os
 
-    project_dir = project_dir.resolve()
+    project_dir = _absolute(project_dir)
     state_dir = project_dir / ".aurelia" / "state"
-    if not state_dir.exists():
+    if not os.path.isdir(state_dir):
         click.echo("No state directory found — has the runtime been started?")
         raise SystemExit(1)
 
-    runtime_file = state_dir / "runtime.json"
-    if not runtime_file.exists():
+    try:
+        data = json.loads((state_dir / "runtime.json").read_bytes())
+    except (OSError, json.JSONDecodeError):
         click.echo("No runtime state found.")
         raise SystemExit(1)
 
-    data = json.loads(runtime_file.read_text())
     click.echo(f"Runtime status : {data.get('status', 'unknown')}")
     click.echo(f"Heartbeat count: {data.get('heartbeat_count', 0)}")
     click.echo(f"Tasks dispatched: {data.get('total_tasks_dispatched', 0)}")
@@ -150,10 +161,21 @@ def reset(project_dir: Path, keep_worktrees: bool) -> None:
     This removes all candidates, tasks, evaluations, and event logs.
     Git worktrees are cleaned up by default.
     """
-    _reset_state(project_dir.resolve(), keep_worktrees=keep_worktrees)
+    _reset_state(_absolute(project_dir), keep_worktrees=keep_worktrees)
     click.echo("State cleared. Ready for a fresh start.")
 
 
+def _absolute(path: Path) -> Path:
+    """Make *path* absolute without a symlink walk unless `..` needs one.
+
+    Path.resolve() lstat()s every component; an absolute path without `..`
+    (the usual Path.cwd() default) is already what git operations need.
+    """
+    if ".." in path.parts:
+        return path.resolve()
+    return path.absolute()
+
+
 def _reset_state(project_dir: Path, keep_worktrees: bool = False) -> None:
     """Clear all Aurelia state files and optionally git worktrees."""
     import shutil
@@ -178,31 +200,44 @@ def _reset_state(project_dir: Path, keep_worktrees: bool = False) -> None:
     # Clear worktrees
     if not keep_worktrees:
         import subprocess
+        from concurrent.futures import ThreadPoolExecutor
 
         worktrees_dir = aurelia_dir / "worktrees"
+        # Resolve git once so each spawn below skips the PATH search, and pass
+        # the directory via -C rather than cwd: with no cwd and close_fds=False
+        # subprocess can launch git with posix_spawn instead of fork + exec
+        git = [shutil.which("git") or "git", "-C", str(project_dir)]
 
         # First, prune any stale worktree references
         subprocess.run(
-            ["git", "worktree", "prune"],
-            cwd=project_dir,
-            capture_output=True,
+            [*git, "worktree", "prune"],
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
-        # List all worktrees and remove aurelia ones
-        result = subprocess.run(
-            ["git", "worktree", "list", "--porcelain"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        for line in result.stdout.splitlines():
-            if line.startswith("worktree ") and "/aurelia/" in line:
-                wt_path = line.replace("worktree ", "").strip()
-                subprocess.run(
-                    ["git", "worktree", "remove", "--force", wt_path],
-                    cwd=project_dir,
-                    capture_output=True,
-                )
+        # Stream the worktree list and remove aurelia ones as they are read.
+        # git worktree remove takes one path, so run the removals side by
+        # side; anything left behind is swept up by the rmtree and prune below
+        with (
+            ThreadPoolExecutor(max_workers=8) as executor,
+            subprocess.Popen(
+                [*git, "worktree", "list", "--porcelain"],
+                close_fds=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ) as proc,
+        ):
+            for line in proc.stdout:
+                if line.startswith("worktree ") and "/aurelia/" in line:
+                    executor.submit(
+                        subprocess.run,
+                        [*git, "worktree", "remove", "--force", line[len("worktree ") :].strip()],
+                        close_fds=False,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
 
         # Clean up any remaining directories
         if worktrees_dir.exists():
@@ -212,32 +247,33 @@ def _reset_state(project_dir: Path, keep_worktrees: bool = False) -> None:
 
         # Prune again to clean up any newly stale references
         subprocess.run(
-            ["git", "worktree", "prune"],
-            cwd=project_dir,
-            capture_output=True,
+            [*git, "worktree", "prune"],
+            close_fds=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Clean up aurelia branches
         try:
             result = subprocess.run(
-                ["git", "branch", "--list", "aurelia/*"],
-                cwd=project_dir,
+                [*git, "branch", "--list", "aurelia/*"],
+                close_fds=False,
                 capture_output=True,
                 text=True,
             )
-            deleted = 0
-            for line in result.stdout.splitlines():
-                # Strip leading whitespace, '*' (current), and '+' (worktree)
-                branch = line.lstrip(" *+").strip()
-                if branch and branch.startswith("aurelia/"):
-                    subprocess.run(
-                        ["git", "branch", "-D", branch],
-                        cwd=project_dir,
-                        capture_output=True,
-                    )
-                    deleted += 1
-            if deleted:
-                click.echo(f"Deleted {deleted} aurelia branches.")
+            # Strip leading whitespace, '*' (current), and '+' (worktree)
+            branches = [line.lstrip(" *+").strip() for line in result.stdout.splitlines()]
+            branches = [b for b in branches if b.startswith("aurelia/")]
+            # git branch -D accepts many names; batch them to stay under ARG_MAX
+            for i in range(0, len(branches), _BRANCH_DELETE_BATCH):
+                subprocess.run(
+                    [*git, "branch", "-D", *branches[i : i + _BRANCH_DELETE_BATCH]],
+                    close_fds=False,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            if branches:
+                click.echo(f"Deleted {len(branches)} aurelia branches.")
         except Exception:
             pass
 
@@ -265,18 +301,25 @@ def monitor(project_dir: Path, poll_interval: float) -> None:
     """Open the live monitoring dashboard."""
     from aurelia.monitor import run_monitor
 
-    run_monitor(project_dir.resolve(), poll_interval)
+    run_monitor(_absolute(project_dir), poll_interval)
 
 
 @cli.command()
 @click.option(
     "--project-dir",
-    type=click.Path(exists=True, path_type=Path),
+    type=Path,
     default=Path.cwd,
     help="Project root directory.",
 )
-def report(project_dir: Path) -> None:
+@click.option(
+    "--max-rows",
+    type=click.IntRange(min=0),
+    default=200,
+    show_default=True,
+    help="Rows shown per table (0=all).",
+)
+def report(project_dir: Path, max_rows: int) -> None:
     """Generate a summary report of the last run."""
     from aurelia.cli.report_cmd import run_report
 
-    run_report(project_dir.resolve())
+    run_report(_absolute(project_dir), max_rows=max_rows)
@@ -2,221 +2,444 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import sys
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import click
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
 
-def run_report(project_dir: Path) -> None:
-    """Generate and print a summary report of the last Aurelia run."""
+# Parsed state files, reused while a file's (mtime_ns, size) is unchanged
+_JSON_CACHE: OrderedDict[tuple[Path, Callable | None], tuple[int, int, dict | list]] = OrderedDict()
+_JSON_CACHE_SIZE = 16
+
+# Rendered report, keyed by the state files' (mtime_ns, size). Bump the version
+# whenever the report layout changes so stale renders are not replayed.
+_REPORT_CACHE_NAME = ".report.cache"
+_REPORT_CACHE_VERSION = 1
+_REPORT_INPUTS = ("runtime.json", "candidates.json", "evaluations.json", "tasks.json")
+
+
+def run_report(project_dir: Path, max_rows: int = 200) -> None:
+    """Generate and print a summary report of the last Aurelia run.
+
+    The candidate and evaluation tables show at most *max_rows* rows each
+    (0 shows everything), followed by a count of the rows left out.
+    """
     state_dir = project_dir / ".aurelia" / "state"
 
-    if not state_dir.exists():
+    if not os.path.isdir(state_dir):
         click.echo("No .aurelia/state directory found.")
         return
 
-    runtime = _load_json(state_dir / "runtime.json")
-    candidates = _load_json(state_dir / "candidates.json")
-    evaluations = _load_json(state_dir / "evaluations.json")
-    tasks = _load_json(state_dir / "tasks.json")
+    # Reuse the last rendered report if none of the state files changed
+    cache_file = state_dir / _REPORT_CACHE_NAME
+    cache_key = _report_cache_key(state_dir, max_rows)
+    cached = _read_report_cache(cache_file, cache_key)
+    if cached is not None:
+        click.echo(cached)
+        return
+
+    # The reads are independent blocking I/O, so issue them side by side
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        runtime_f = executor.submit(_load_json, state_dir / "runtime.json")
+        candidates_f = executor.submit(
+            _load_json, state_dir / "candidates.json", _project_candidates
+        )
+        evaluations_f = executor.submit(
+            _load_json, state_dir / "evaluations.json", _project_evaluations
+        )
+        tasks_f = executor.submit(_load_json, state_dir / "tasks.json", _project_tasks)
+    runtime = runtime_f.result()
+    candidates = candidates_f.result()
+    evaluations = evaluations_f.result()
+    tasks = tasks_f.result()
 
     if runtime is None:
         click.echo("No runtime state found.")
         return
 
-    _print_run_summary(runtime)
-    _print_candidate_summary(candidates or [], evaluations or [])
-    _print_best_candidate(evaluations or [])
-    _print_task_stats(tasks or [])
-    _print_metric_progression(evaluations or [])
-    _print_failures(candidates or [], tasks or [])
+    agg = _aggregate(candidates or [], evaluations or [], tasks or [])
+
+    # Collect the whole report and write it in one go rather than per line
+    out: list[str] = []
+    _print_run_summary(out, runtime)
+    _print_candidate_summary(out, agg, max_rows)
+    _print_best_candidate(out, agg.best)
+    _print_task_stats(out, agg.by_component)
+    _print_metric_progression(out, agg.history_rows, max_rows)
+    _print_failures(out, agg)
+    report = "\n".join(out)
+    _write_report_cache(cache_file, cache_key, report)
+    click.echo(report)
+
+
+def _report_cache_key(state_dir: Path, max_rows: int) -> str:
+    """Describe the report inputs: layout version, row limit and each file's stat."""
+    parts = [f"v{_REPORT_CACHE_VERSION}", f"rows={max_rows}"]
+    for name in _REPORT_INPUTS:
+        try:
+            st = os.stat(state_dir / name)
+        except OSError:
+            parts.append("-")
+        else:
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+    return " ".join(parts)
+
+
+def _read_report_cache(cache_file: Path, key: str) -> str | None:
+    """Return the cached report if it was rendered for *key*."""
+    try:
+        content = cache_file.read_text()
+    except OSError:
+        return None
+    cached_key, sep, report = content.partition("\n")
+    return report if sep and cached_key == key else None
+
+
+def _write_report_cache(cache_file: Path, key: str, report: str) -> None:
+    """Store the rendered report atomically; failures only cost the cache."""
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(f"{key}\n{report}")
+        os.replace(tmp, cache_file)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _load_json(path: Path, project: Callable[[list], list] | None = None) -> dict | list | None:
+    """Load a JSON file, returning None if missing or corrupt.
+
+    If *project* is given it is applied to a top-level list before caching, so
+    only the projected records are kept alive. Results are cached by path and
+    reused as long as the file's mtime and size are unchanged, so callers must
+    treat the returned object as read-only.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
 
+    key = (path, project)
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _JSON_CACHE.move_to_end(key)
+        return cached[2]
 
-def _load_json(path: Path) -> dict | list | None:
-    """Load a JSON file, returning None if missing or corrupt."""
     try:
-        return json.loads(path.read_text())
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        data = _parse_json(_read_bytes(path, st.st_size))
+    except (json.JSONDecodeError, OSError):
         return None
+    if project is not None and isinstance(data, list):
+        data = project(data)
+
+    _JSON_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _JSON_CACHE.move_to_end(key)
+    if len(_JSON_CACHE) > _JSON_CACHE_SIZE:
+        _JSON_CACHE.popitem(last=False)
+    return data
+
+
+def _read_bytes(path: Path, size: int) -> bytes:
+    """Read a whole file whose size is already known from a stat.
+
+    Uses raw os.read on a descriptor, skipping the buffered file object and
+    the extra fstat that Path.read_bytes() sets up.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+        # Pick up anything appended since the stat
+        while chunk := os.read(fd, 65536):
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _parse_json(raw: bytes) -> dict | list:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN metrics, which only the stdlib parser accepts
+    return json.loads(raw)
+
+
+def _interned(value: object) -> object:
+    """Intern string values so repeated statuses and names share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _project_candidates(candidates: list) -> list[dict]:
+    """Keep only the candidate fields the report reads."""
+    fields = ("id", "status", "branch")
+    return [{k: _interned(c[k]) for k in fields if k in c} for c in candidates]
+
+
+def _project_tasks(tasks: list) -> list[dict]:
+    """Keep only the task fields the report reads."""
+    projected = []
+    for task in tasks:
+        lite = {k: _interned(task[k]) for k in ("component", "status", "branch") if k in task}
+        result = task.get("result")
+        if result:
+            lite["result"] = {"error": result.get("error", "unknown")}
+        projected.append(lite)
+    return projected
+
+
+def _project_evaluations(evaluations: list) -> list[dict]:
+    """Keep only the evaluation fields the report reads."""
+    projected = []
+    for ev in evaluations:
+        lite = {k: ev[k] for k in ("id", "commit_sha", "metrics", "passed") if k in ev}
+        if "candidate_branch" in ev:
+            lite["candidate_branch"] = _interned(ev["candidate_branch"])
+        projected.append(lite)
+    return projected
 
 
-def _print_run_summary(runtime: dict) -> None:
-    click.echo("=" * 60)
-    click.echo("  Run Summary")
-    click.echo("=" * 60)
+def _print_run_summary(out: list[str], runtime: dict) -> None:
+    out.append("=" * 60)
+    out.append("  Run Summary")
+    out.append("=" * 60)
 
     status = runtime.get("status", "unknown")
-    click.echo(f"  Status          : {status}")
+    out.append(f"  Status          : {status}")
 
     started = runtime.get("started_at")
     stopped = runtime.get("stopped_at")
     if started:
-        click.echo(f"  Started         : {_fmt_time(started)}")
+        out.append(f"  Started         : {_fmt_time(started)}")
     if stopped:
-        click.echo(f"  Stopped         : {_fmt_time(stopped)}")
+        out.append(f"  Stopped         : {_fmt_time(stopped)}")
     if started and stopped:
         duration = _parse_time(stopped) - _parse_time(started)
         total_s = int(duration.total_seconds())
         mins, secs = divmod(total_s, 60)
-        click.echo(f"  Duration        : {mins}m {secs}s")
-
-    click.echo(f"  Heartbeats      : {runtime.get('heartbeat_count', 0)}")
-    click.echo(f"  Tasks dispatched: {runtime.get('total_tasks_dispatched', 0)}")
-    click.echo(f"  Tasks completed : {runtime.get('total_tasks_completed', 0)}")
-    click.echo(f"  Tasks failed    : {runtime.get('total_tasks_failed', 0)}")
-    click.echo()
-
-
-def _print_candidate_summary(candidates: list, evaluations: list) -> None:
-    if not candidates:
-        return
-
-    eval_by_branch = {}
+        out.append(f"  Duration        : {mins}m {secs}s")
+
+    out.append(f"  Heartbeats      : {runtime.get('heartbeat_count', 0)}")
+    out.append(f"  Tasks dispatched: {runtime.get('total_tasks_dispatched', 0)}")
+    out.append(f"  Tasks completed : {runtime.get('total_tasks_completed', 0)}")
+    out.append(f"  Tasks failed    : {runtime.get('total_tasks_failed', 0)}")
+    out.append("")
+
+
+@dataclass(slots=True)
+class _ComponentStats:
+    """Task outcome counts for one component."""
+
+    success: int = 0
+    failed: int = 0
+    other: int = 0
+
+
+@dataclass(slots=True)
+class _Aggregate:
+    """Everything the report prints, gathered in one pass per state list."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    # (id, status, branch, metrics) per candidate
+    candidate_rows: list[tuple[str, str, str, str]] = field(default_factory=list)
+    best: dict | None = None
+    by_component: defaultdict[str, _ComponentStats] = field(
+        default_factory=lambda: defaultdict(_ComponentStats)
+    )
+    # (id, PASS/FAIL, branch, metrics) per evaluation
+    history_rows: list[tuple[str, str, str, str]] = field(default_factory=list)
+    # (id, error) per failed candidate
+    failure_rows: list[tuple[str, str]] = field(default_factory=list)
+
+
+def _aggregate(candidates: list, evaluations: list, tasks: list) -> _Aggregate:
+    """Walk each state list once, collecting all report sections at the same time."""
+    agg = _Aggregate(total=len(candidates))
+
+    # Evaluations: latest metrics per branch, best passing run, history table
+    latest_metrics: dict[str | None, str] = {}
+    scored: list[tuple[float, dict]] = []
     for ev in evaluations:
-        eval_by_branch.setdefault(ev.get("candidate_branch"), []).append(ev)
-
-    succeeded = sum(1 for c in candidates if c.get("status") == "succeeded")
-    failed = sum(1 for c in candidates if c.get("status") == "failed")
+        metrics = ev.get("metrics", {})
+        metrics_str = _fmt_metrics(metrics)
+        branch = ev.get("candidate_branch")
+        latest_metrics[branch] = metrics_str
+        passed = ev.get("passed")
+        agg.history_rows.append(
+            (
+                ev.get("id", "?"),
+                "PASS" if passed else "FAIL",
+                ev.get("candidate_branch", "?"),
+                metrics_str,
+            )
+        )
+        if passed:
+            score = _avg_numeric(metrics)
+            if score is not None and score > -1.0:
+                scored.append((score, ev))
 
-    click.echo("-" * 60)
-    click.echo("  Candidates")
-    click.echo("-" * 60)
-    click.echo(f"  Total: {len(candidates)}  |  Succeeded: {succeeded}  |  Failed: {failed}")
-    click.echo()
+    # Best passing evaluation by average numeric metric; max keeps the first on ties
+    if scored:
+        agg.best = max(scored, key=itemgetter(0))[1]
 
-    # Table
-    click.echo(f"  {'ID':<12} {'Status':<12} {'Branch':<30} {'Metrics'}")
-    click.echo(f"  {'─' * 12} {'─' * 12} {'─' * 30} {'─' * 20}")
+    # Tasks: per-component status counts and the last error per branch
+    task_errors: dict[str, str] = {}
+    for task in tasks:
+        status = task.get("status", "unknown")
+        stats = agg.by_component[task.get("component", "unknown")]
+        if status == "success":
+            stats.success += 1
+        elif status == "failed":
+            stats.failed += 1
+        else:
+            stats.other += 1
+        if status == "failed" and task.get("result"):
+            task_errors[task.get("branch", "")] = task["result"].get("error", "unknown")
 
+    # Candidates: status counts, table rows and failures
     for cand in candidates:
         cid = cand.get("id", "?")
         status = cand.get("status", "?")
         branch = cand.get("branch", "?")
+        if status == "succeeded":
+            agg.succeeded += 1
+        elif status == "failed":
+            agg.failed += 1
+            agg.failure_rows.append((cid, task_errors.get(branch, "unknown")))
+        agg.candidate_rows.append((cid, status, branch, latest_metrics.get(branch, "-")))
+
+    return agg
 
-        # Find metrics for this candidate
-        evals = eval_by_branch.get(branch, [])
-        if evals:
-            metrics = evals[-1].get("metrics", {})
-            metrics_str = ", ".join(
-                f"{k}={v:.4f}" if isinstance(v, float) else f"{k}={v}" for k, v in metrics.items()
-            )
-        else:
-            metrics_str = "-"
 
-        click.echo(f"  {cid:<12} {status:<12} {branch:<30} {metrics_str}")
+def _avg_numeric(metrics: dict) -> float | None:
+    """Average of the numeric metric values, or None if there are none."""
+    total = 0.0
+    count = 0
+    for v in metrics.values():
+        if isinstance(v, (int, float)):
+            total += v
+            count += 1
+    return total / count if count else None
 
-    click.echo()
 
+def _fmt_metrics(metrics: dict) -> str:
+    # Parsed JSON only ever yields exact floats, so an identity check on the
+    # type is enough; a list lets join size the result up front
+    return ", ".join(
+        [f"{k}={v:.4f}" if type(v) is float else f"{k}={v}" for k, v in metrics.items()]
+    )
 
-def _print_best_candidate(evaluations: list) -> None:
-    passed = [e for e in evaluations if e.get("passed")]
-    if not passed:
+
+def _print_candidate_summary(out: list[str], agg: _Aggregate, max_rows: int = 0) -> None:
+    if not agg.candidate_rows:
         return
 
-    # Find evaluation with highest average metric
-    best = None
-    best_score = -1.0
-    for ev in passed:
-        metrics = ev.get("metrics", {})
-        nums = [v for v in metrics.values() if isinstance(v, (int, float))]
-        if nums:
-            score = sum(nums) / len(nums)
-            if score > best_score:
-                best_score = score
-                best = ev
+    out.append("-" * 60)
+    out.append("  Candidates")
+    out.append("-" * 60)
+    out.append(f"  Total: {agg.total}  |  Succeeded: {agg.succeeded}  |  Failed: {agg.failed}")
+    out.append("")
 
+    # Table
+    out.append(f"  {'ID':<12} {'Status':<12} {'Branch':<30} {'Metrics'}")
+    out.append(f"  {'─' * 12} {'─' * 12} {'─' * 30} {'─' * 20}")
+
+    for cid, status, branch, metrics_str in _head(agg.candidate_rows, max_rows):
+        out.append(f"  {cid:<12} {status:<12} {branch:<30} {metrics_str}")
+    _append_omitted(out, agg.candidate_rows, max_rows)
+
+    out.append("")
+
+
+def _print_best_candidate(out: list[str], best: dict | None) -> None:
     if best is None:
         return
 
-    click.echo("-" * 60)
-    click.echo("  Best Candidate")
-    click.echo("-" * 60)
-    click.echo(f"  Branch : {best.get('candidate_branch', '?')}")
-    click.echo(f"  Commit : {best.get('commit_sha', '?')}")
+    out.append("-" * 60)
+    out.append("  Best Candidate")
+    out.append("-" * 60)
+    out.append(f"  Branch : {best.get('candidate_branch', '?')}")
+    out.append(f"  Commit : {best.get('commit_sha', '?')}")
     metrics = best.get("metrics", {})
     for key, val in metrics.items():
         if isinstance(val, float):
-            click.echo(f"  {key:<9}: {val:.6f}")
+            out.append(f"  {key:<9}: {val:.6f}")
         else:
-            click.echo(f"  {key:<9}: {val}")
-    click.echo()
+            out.append(f"  {key:<9}: {val}")
+    out.append("")
 
 
-def _print_task_stats(tasks: list) -> None:
-    if not tasks:
+def _print_task_stats(out: list[str], by_component: dict[str, _ComponentStats]) -> None:
+    if not by_component:
         return
 
-    click.echo("-" * 60)
-    click.echo("  Task Breakdown by Component")
-    click.echo("-" * 60)
+    out.append("-" * 60)
+    out.append("  Task Breakdown by Component")
+    out.append("-" * 60)
 
-    by_component: dict[str, dict[str, int]] = {}
-    for task in tasks:
-        comp = task.get("component", "unknown")
-        status = task.get("status", "unknown")
-        if comp not in by_component:
-            by_component[comp] = {}
-        by_component[comp][status] = by_component[comp].get(status, 0) + 1
+    out.append(f"  {'Component':<12} {'Success':<10} {'Failed':<10} {'Other':<10}")
+    out.append(f"  {'─' * 12} {'─' * 10} {'─' * 10} {'─' * 10}")
 
-    click.echo(f"  {'Component':<12} {'Success':<10} {'Failed':<10} {'Other':<10}")
-    click.echo(f"  {'─' * 12} {'─' * 10} {'─' * 10} {'─' * 10}")
+    for comp, stats in sorted(by_component.items()):
+        out.append(f"  {comp:<12} {stats.success:<10} {stats.failed:<10} {stats.other:<10}")
 
-    for comp, statuses in sorted(by_component.items()):
-        success = statuses.get("success", 0)
-        failed = statuses.get("failed", 0)
-        other = sum(v for k, v in statuses.items() if k not in ("success", "failed"))
-        click.echo(f"  {comp:<12} {success:<10} {failed:<10} {other:<10}")
+    out.append("")
 
-    click.echo()
 
-
-def _print_metric_progression(evaluations: list) -> None:
-    if not evaluations:
+def _print_metric_progression(
+    out: list[str], history_rows: list[tuple[str, str, str, str]], max_rows: int = 0
+) -> None:
+    if not history_rows:
         return
 
-    click.echo("-" * 60)
-    click.echo("  Evaluation History")
-    click.echo("-" * 60)
+    out.append("-" * 60)
+    out.append("  Evaluation History")
+    out.append("-" * 60)
 
-    for ev in evaluations:
-        eid = ev.get("id", "?")
-        branch = ev.get("candidate_branch", "?")
-        passed = "PASS" if ev.get("passed") else "FAIL"
-        metrics = ev.get("metrics", {})
-        metrics_str = ", ".join(
-            f"{k}={v:.4f}" if isinstance(v, float) else f"{k}={v}" for k, v in metrics.items()
-        )
-        click.echo(f"  {eid:<12} {passed:<6} {branch:<30} {metrics_str}")
+    for eid, passed, branch, metrics_str in _head(history_rows, max_rows):
+        out.append(f"  {eid:<12} {passed:<6} {branch:<30} {metrics_str}")
+    _append_omitted(out, history_rows, max_rows)
 
-    click.echo()
+    out.append("")
 
 
-def _print_failures(candidates: list, tasks: list) -> None:
-    failed_cands = [c for c in candidates if c.get("status") == "failed"]
-    if not failed_cands:
+def _print_failures(out: list[str], agg: _Aggregate) -> None:
+    if not agg.failure_rows:
         return
 
-    # Build task error lookup by branch
-    task_errors: dict[str, str] = {}
-    for task in tasks:
-        if task.get("status") == "failed" and task.get("result"):
-            branch = task.get("branch", "")
-            error = task["result"].get("error", "unknown")
-            task_errors[branch] = error
+    out.append("-" * 60)
+    out.append("  Failures")
+    out.append("-" * 60)
 
-    click.echo("-" * 60)
-    click.echo("  Failures")
-    click.echo("-" * 60)
+    for cid, error in agg.failure_rows:
+        out.append(f"  {cid}: {error[:80]}")
+
+    out.append("")
+
+
+def _head(rows: list, max_rows: int) -> list:
+    return rows[:max_rows] if max_rows > 0 else rows
 
-    for cand in failed_cands:
-        cid = cand.get("id", "?")
-        branch = cand.get("branch", "?")
-        error = task_errors.get(branch, "unknown")
-        click.echo(f"  {cid}: {error[:80]}")
 
-    click.echo()
+def _append_omitted(out: list[str], rows: list, max_rows: int) -> None:
+    if 0 < max_rows < len(rows):
+        out.append(f"  ... and {len(rows) - max_rows} more (use --max-rows 0 to show all)")
 
 
 def _fmt_time(iso_str: str) -> str:
@@ -228,8 +451,7 @@ def _fmt_time(iso_str: str) -> str:
         return iso_str
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_time(iso_str: str) -> datetime:
-    """Parse an ISO timestamp string."""
-    # Handle trailing Z
-    s = iso_str.replace("Z", "+00:00")
-    return datetime.fromisoformat(s)
+    """Parse an ISO timestamp string (a trailing Z is accepted natively on 3.11+)."""
+    return datetime.fromisoformat(iso_str)
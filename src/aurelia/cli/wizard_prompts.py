@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-
-def get_readme_prompt(summary: str) -> str:
-    """Get system prompt for README.md creation."""
-    return f'''You are helping set up a new Aurelia project.
+_README_PROMPT = """You are helping set up a new Aurelia project.
 
 The user provided this project summary:
 "{summary}"
@@ -28,12 +25,9 @@ Your task:
 4. Only write the file after the user confirms they are happy with it
 
 Be conversational and helpful. The user is in control of this process.
-Keep the README concise - it should fit on one screen.'''
+Keep the README concise - it should fit on one screen."""
 
-
-def get_evaluate_prompt() -> str:
-    """Get system prompt for evaluate.py creation."""
-    return '''You are helping create an evaluation script for an Aurelia project.
+_EVALUATE_PROMPT = """You are helping create an evaluation script for an Aurelia project.
 
 First, read the README.md to understand the problem being solved.
 
@@ -63,12 +57,9 @@ Your task:
 6. Show the user your code and get their approval before finalizing
 
 The goal is a working evaluation harness, not a complex one.
-Keep it simple and focused on the metrics that matter.'''
+Keep it simple and focused on the metrics that matter."""
 
-
-def get_solution_prompt() -> str:
-    """Get system prompt for baseline solution creation."""
-    return '''You are helping create a baseline solution for an Aurelia project.
+_SOLUTION_PROMPT = """You are helping create a baseline solution for an Aurelia project.
 
 First, read:
 - README.md to understand the problem
@@ -98,4 +89,19 @@ Your task:
 
 IMPORTANT: The priority is a WORKING baseline that passes all tests.
 It does NOT need to be optimal - the user will use Aurelia to improve it.
-A simple, correct solution is better than a complex, broken one.'''
+A simple, correct solution is better than a complex, broken one."""
+
+
+def get_readme_prompt(summary: str) -> str:
+    """Get system prompt for README.md creation."""
+    return _README_PROMPT.format(summary=summary)
+
+
+def get_evaluate_prompt() -> str:
+    """Get system prompt for evaluate.py creation."""
+    return _EVALUATE_PROMPT
+
+
+def get_solution_prompt() -> str:
+    """Get system prompt for baseline solution creation."""
+    return _SOLUTION_PROMPT
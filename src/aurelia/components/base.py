@@ -8,13 +8,20 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import hashlib
 import json
 import logging
+import math
+import random
 import time
-from typing import Any
+import weakref
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any, ClassVar
 
-from google.genai import types
+import anyio.to_thread
+from google.genai import errors, types
 
 from aurelia.core.events import EventLog
 from aurelia.core.ids import IdGenerator
@@ -24,11 +31,82 @@ from aurelia.core.models import (
     Task,
     TaskResult,
 )
+from aurelia.llm.cache import LLMCache
 from aurelia.llm.client import LLMClient
 from aurelia.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Longest server-requested Retry-After delay honoured between LLM attempts
+_MAX_RETRY_AFTER_S = 30.0
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Return whether a failed LLM call may succeed when simply repeated.
+
+    Client errors other than timeouts and rate limits (bad request, bad
+    credentials, missing model) fail the same way on every attempt.
+    """
+    if isinstance(exc, errors.ClientError):
+        return exc.code in (408, 429)
+    return True
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Return the server's ``Retry-After`` delay in seconds, if it sent one.
+
+    The delay is capped at ``_MAX_RETRY_AFTER_S`` so a huge value cannot stall
+    the task; non-finite values are ignored in favour of the backoff.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        delay = float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None  # absent, or an HTTP date: fall back to the backoff
+    if not math.isfinite(delay):
+        return None
+    return min(max(0.0, delay), _MAX_RETRY_AFTER_S)
+
+
+def _fingerprint_content(content: types.Content) -> bytes:
+    """Return a SHA-256 fingerprint of one conversation turn.
+
+    Text and inline data, the bulky fields, are fed to the hash as raw
+    length-prefixed bytes; whatever else a part carries (function calls and
+    responses, file references, ...) is fed as sorted JSON.
+    """
+    digest = hashlib.sha256()
+
+    def feed(tag: bytes, data: bytes) -> None:
+        digest.update(tag + len(data).to_bytes(8, "big"))
+        digest.update(data)
+
+    feed(b"role", (content.role or "").encode())
+    for part in content.parts or []:
+        feed(b"part", b"")
+        if part.text is not None:
+            feed(b"text", part.text.encode())
+        if part.inline_data is not None:
+            feed(b"mime", (part.inline_data.mime_type or "").encode())
+            feed(b"data", part.inline_data.data or b"")
+        rest = part.model_dump(exclude_none=True, exclude={"text", "inline_data"})
+        if rest:
+            feed(b"json", json.dumps(rest, sort_keys=True, default=str).encode())
+    return digest.digest()
+
+
+def _forget_digest(
+    digests: dict[int, tuple[weakref.ref[types.Content], bytes]],
+    key: int,
+    ref: weakref.ref[types.Content],
+) -> None:
+    """Drop a memoized fingerprint once its turn is garbage collected."""
+    entry = digests.get(key)
+    if entry is not None and entry[0] is ref:
+        del digests[key]
+
 
 class BaseComponent:
     """Component that executes a task via an LLM tool-use loop.
@@ -38,6 +116,9 @@ class BaseComponent:
     behaviour without replacing the core loop.
     """
 
+    # Deterministic LLM calls in flight, shared by all components: request key -> result
+    _inflight: ClassVar[dict[str, asyncio.Future[types.GenerateContentResponse]]] = {}
+
     def __init__(
         self,
         spec: ComponentSpec,
@@ -45,12 +126,17 @@ class BaseComponent:
         tool_registry: ToolRegistry,
         event_log: EventLog,
         id_generator: IdGenerator,
+        llm_cache: LLMCache | None = None,
     ) -> None:
         self._spec = spec
         self._llm_client = llm_client
         self._tool_registry = tool_registry
         self._event_log = event_log
         self._id_gen = id_generator
+        self._llm_cache = llm_cache
+        # id(content) -> (weakref to it, its fingerprint) for _hash_contents;
+        # entries remove themselves when their content is collected
+        self._content_digests: dict[int, tuple[weakref.ref[types.Content], bytes]] = {}
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -67,24 +153,24 @@ class BaseComponent:
         system_prompt = self._build_system_prompt(task)
         contents = self._build_contents(task)
 
-        # -- tool declarations --
-        decls = self._tool_registry.get_declarations(self._spec.tools)
-        tools: list[types.Tool] | None = None
-        if decls:
-            tools = [
-                types.Tool(function_declarations=[types.FunctionDeclaration(**d) for d in decls])
-            ]
-
         config = types.GenerateContentConfig(
             system_instruction=system_prompt or None,
             temperature=self._spec.model.temperature,
             max_output_tokens=self._spec.model.max_output_tokens,
-            tools=tools,
+            tools=self._tools,
         )
 
         final_content = await self._tool_use_loop(task, contents, config)
         return self._parse_result(task, final_content)
 
+    @functools.cached_property
+    def _tools(self) -> list[types.Tool] | None:
+        """Tool declarations for the spec's tools, built once per component."""
+        decls = self._tool_registry.get_declarations(self._spec.tools)
+        if not decls:
+            return None
+        return [types.Tool(function_declarations=[types.FunctionDeclaration(**d) for d in decls])]
+
     # ------------------------------------------------------------------
     # Tool-use loop
     # ------------------------------------------------------------------
@@ -106,28 +192,34 @@ class BaseComponent:
             content = response.candidates[0].content
             contents.append(content)
 
-            # Collect function calls from the response parts.
-            function_calls: list[types.FunctionCall] = []
-            for part in content.parts or []:
-                if part.function_call:
-                    function_calls.append(part.function_call)
-
+            # A text-only response (the usual final round) ends the loop.
+            function_calls = [
+                part.function_call for part in content.parts or [] if part.function_call
+            ]
             if not function_calls:
                 return content
 
-            # Execute each tool and build function-response parts.
-            response_parts: list[types.Part] = []
+            # Execute the tools and build function-response parts.  Runs of
+            # read-only calls go concurrently; any other call waits for the
+            # calls before it, so side effects happen in the model's order.
+            results: list[dict[str, Any]] = []
+            pending: list[Coroutine[Any, Any, dict[str, Any]]] = []
             for fc in function_calls:
                 logger.debug("Tool call: %s(%s)", fc.name, fc.args)
-                result = await self._execute_tool(fc.name, dict(fc.args) if fc.args else {})
-                response_parts.append(
-                    types.Part(
-                        function_response=types.FunctionResponse(
-                            name=fc.name,
-                            response=result,
-                        )
-                    )
-                )
+                # FunctionCall.args is already a dict and tools only read it
+                call = self._execute_tool(fc.name, fc.args or {})
+                if self._tool_registry.is_read_only(fc.name):
+                    pending.append(call)
+                    continue
+                results.extend(await asyncio.gather(*pending))
+                pending.clear()
+                results.append(await call)
+            results.extend(await asyncio.gather(*pending))
+
+            response_parts = [
+                types.Part(function_response=types.FunctionResponse(name=fc.name, response=result))
+                for fc, result in zip(function_calls, results, strict=True)
+            ]
 
             contents.append(types.Content(parts=response_parts, role="user"))
 
@@ -150,74 +242,136 @@ class BaseComponent:
     ) -> types.GenerateContentResponse:
         """Call the LLM with exponential-backoff retry (3 attempts).
 
-        Emits ``llm.request`` and ``llm.response`` events.
+        Emits one ``llm.call`` event per successful attempt and one
+        ``llm.call_failed`` per failed attempt.  At ``temperature == 0`` a
+        request identical to an earlier one is answered from the
+        ``llm_cache`` (``llm.call`` with ``cached=True``), and one identical
+        to a call still in flight from any component waits for that call
+        (``coalesced=True``).
         """
+        request_hash = self._hash_contents(contents)
+        if config.temperature != 0:
+            return await self._generate(task, contents, config, request_hash)
+
+        request_key = self._request_key(request_hash, config)
+        if self._llm_cache is not None:
+            cached = await self._llm_cache.lookup(request_key)
+            if cached is not None:
+                await self._emit_llm_event(
+                    "llm.call",
+                    task,
+                    request_hash,
+                    input_tokens=0,
+                    output_tokens=0,
+                    latency_ms=0,
+                    cached=True,
+                )
+                return types.GenerateContentResponse.model_validate(cached)
+
+        # A cancelled leader cancels the shared future rather than failing it,
+        # so its waiters retry: the first takes over the call, the rest follow
+        while (inflight := BaseComponent._inflight.get(request_key)) is not None:
+            start = time.monotonic()
+            try:
+                # Shielded: cancelling this waiter must not cancel the shared call
+                response = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if not inflight.cancelled() or (current is not None and current.cancelling()):
+                    raise
+                continue
+            latency_ms = int((time.monotonic() - start) * 1000)
+            await self._emit_llm_event(
+                "llm.call",
+                task,
+                request_hash,
+                input_tokens=0,
+                output_tokens=0,
+                latency_ms=latency_ms,
+                coalesced=True,
+            )
+            return response
+
+        future: asyncio.Future[types.GenerateContentResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        BaseComponent._inflight[request_key] = future
+        try:
+            response = await self._generate(task, contents, config, request_hash, request_key)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved: no "never retrieved" log without waiters
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            del BaseComponent._inflight[request_key]
+        return response
+
+    async def _generate(
+        self,
+        task: Task,
+        contents: list[types.Content],
+        config: types.GenerateContentConfig,
+        request_hash: str,
+        request_key: str | None = None,
+    ) -> types.GenerateContentResponse:
+        """Call the client with retries, emit events, and fill the cache."""
         max_attempts = 3
         backoff_seconds = [1, 2, 4]
         last_exc: Exception | None = None
 
         for attempt in range(max_attempts):
+            start = time.monotonic()
             try:
-                # -- emit request event --
-                req_seq = self._id_gen.next_event_seq()
-                request_hash = self._hash_contents(contents)
-                await self._event_log.append(
-                    Event(
-                        seq=req_seq,
-                        type="llm.request",
-                        timestamp=datetime.datetime.now(datetime.UTC),
-                        data={
-                            "task_id": task.id,
-                            "component": self._spec.id,
-                            "model": self._spec.model.model,
-                            "request_hash": request_hash,
-                            "attempt": attempt + 1,
-                        },
-                    )
-                )
-
-                start = time.monotonic()
                 response = await self._llm_client.generate(self._spec.model.model, contents, config)
-                latency_ms = int((time.monotonic() - start) * 1000)
-
-                # -- extract token counts when available --
-                input_tokens = 0
-                output_tokens = 0
-                if response.usage_metadata:
-                    input_tokens = response.usage_metadata.prompt_token_count or 0
-                    output_tokens = response.usage_metadata.candidates_token_count or 0
-
-                # -- emit response event --
-                resp_seq = self._id_gen.next_event_seq()
-                await self._event_log.append(
-                    Event(
-                        seq=resp_seq,
-                        type="llm.response",
-                        timestamp=datetime.datetime.now(datetime.UTC),
-                        data={
-                            "task_id": task.id,
-                            "component": self._spec.id,
-                            "model": self._spec.model.model,
-                            "request_hash": request_hash,
-                            "input_tokens": input_tokens,
-                            "output_tokens": output_tokens,
-                            "latency_ms": latency_ms,
-                        },
-                    )
-                )
-
-                return response
-
             except Exception as exc:  # noqa: BLE001
                 last_exc = exc
+                retryable = _is_retryable(exc)
                 logger.warning(
                     "LLM call attempt %d/%d failed: %s",
                     attempt + 1,
                     max_attempts,
                     exc,
                 )
+                await self._emit_llm_event(
+                    "llm.call_failed", task, request_hash, attempt=attempt + 1, error=str(exc)
+                )
+                if not retryable:
+                    raise RuntimeError("LLM call failed with a non-retryable error") from exc
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds[attempt])
+                    delay = _retry_after(exc)
+                    if delay is None:
+                        # Jittered so concurrent callers don't retry in lockstep
+                        delay = backoff_seconds[attempt] * random.uniform(0.5, 1.5)
+                    await asyncio.sleep(delay)
+                continue
+
+            latency_ms = int((time.monotonic() - start) * 1000)
+            usage = response.usage_metadata
+            await self._emit_llm_event(
+                "llm.call",
+                task,
+                request_hash,
+                attempt=attempt + 1,
+                input_tokens=(usage.prompt_token_count or 0) if usage else 0,
+                output_tokens=(usage.candidates_token_count or 0) if usage else 0,
+                latency_ms=latency_ms,
+            )
+
+            # Tool-call turns are not cached: what they lead to depends on
+            # workspace state that the request hash does not cover.
+            if (
+                request_key is not None
+                and self._llm_cache is not None
+                and not response.function_calls
+            ):
+                await self._store_cached(request_key, response)
+
+            return response
 
         raise RuntimeError(f"LLM call failed after {max_attempts} attempts") from last_exc
 
@@ -264,14 +418,72 @@ class BaseComponent:
     # Helpers
     # ------------------------------------------------------------------
 
+    async def _store_cached(self, key: str, response: types.GenerateContentResponse) -> None:
+        """Store *response* in the LLM cache; a failed write is only logged."""
+        try:
+            await self._llm_cache.store(  # type: ignore[union-attr]
+                key,
+                response.model_dump(mode="json", exclude_none=True),
+                {"model": self._spec.model.model, "component": self._spec.id},
+            )
+        except OSError as exc:
+            logger.warning("Could not store LLM response in cache: %s", exc)
+
     @staticmethod
+    async def _write_transcript(path: Path, text: str) -> None:
+        """Write a session transcript from a worker thread; it may be megabytes."""
+
+        def _write() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+
+        await anyio.to_thread.run_sync(_write)
+
+    def _request_key(self, request_hash: str, config: types.GenerateContentConfig) -> str:
+        """Identify a request by model, contents digest, config and tools."""
+        return LLMCache.request_hash(
+            self._spec.model.model,
+            [request_hash],
+            config.model_dump(mode="json", exclude_none=True, exclude={"tools"}),
+            [t.model_dump(mode="json", exclude_none=True) for t in config.tools or []],
+        )
+
+    async def _emit_llm_event(
+        self, event_type: str, task: Task, request_hash: str, **fields: Any
+    ) -> None:
+        """Emit an ``llm.*`` event for *task*'s request *request_hash*."""
+        await self._event_log.append(
+            Event(
+                seq=self._id_gen.next_event_seq(),
+                type=event_type,
+                timestamp=datetime.datetime.now(datetime.UTC),
+                data={
+                    "task_id": task.id,
+                    "component": self._spec.id,
+                    "model": self._spec.model.model,
+                    "request_hash": request_hash,
+                    **fields,
+                },
+            )
+        )
+
     def _hash_contents(
+        self,
         contents: list[types.Content],
     ) -> str:
-        """Produce a stable SHA-256 hex digest of *contents*."""
-        raw = json.dumps(
-            [c.model_dump() for c in contents],
-            sort_keys=True,
-            default=str,
-        )
-        return hashlib.sha256(raw.encode()).hexdigest()
+        """Produce a stable SHA-256 hex digest of *contents*.
+
+        The digest is taken over per-turn fingerprints (see
+        ``_fingerprint_content``), each memoized on the component.  A tool-use
+        loop only appends turns, so every round fingerprints just the new ones.
+        """
+        digest = hashlib.sha256()
+        for content in contents:
+            key = id(content)
+            entry = self._content_digests.get(key)
+            if entry is None or entry[0]() is not content:
+                forget = functools.partial(_forget_digest, self._content_digests, key)
+                entry = (weakref.ref(content, forget), _fingerprint_content(content))
+                self._content_digests[key] = entry
+            digest.update(entry[1])
+        return digest.hexdigest()
@@ -11,22 +11,44 @@ import datetime
 import json
 import logging
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from aurelia.components.base import BaseComponent
+from aurelia.components.prompts import load_template
 from aurelia.core.events import EventLog
 from aurelia.core.ids import IdGenerator
 from aurelia.core.models import ComponentSpec, Event, Task, TaskResult
 from aurelia.llm.client import LLMClient
-from aurelia.sandbox.docker import DockerClient
+from aurelia.sandbox.docker import DockerClient, ensure_image
 from aurelia.tools.registry import ToolRegistry
 
-_PROMPT_DIR = Path(__file__).parent / "prompts"
 _DOCKERFILE_PATH = Path(__file__).parent.parent / "sandbox" / "Dockerfile"
 
+
 logger = logging.getLogger(__name__)
 
 
+def _lines_from_end(text: str) -> Iterator[str]:
+    """Yield the newline-separated lines of *text*, last line first."""
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        yield text[start:end]
+        end = start - 1
+
+
+def _decode_event(line: str, marker: str) -> dict | None:
+    """Decode a stream-json line if it contains *marker*, else return None."""
+    if marker not in line:
+        return None
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
 class CoderComponent(BaseComponent):
     """Component that runs Gemini CLI in a Docker container to modify code."""
 
@@ -111,9 +133,8 @@ class CoderComponent(BaseComponent):
 
             # 5. Save transcript
             transcript_dir = self._project_dir / ".aurelia" / "logs" / "transcripts"
-            transcript_dir.mkdir(parents=True, exist_ok=True)
             transcript_path = transcript_dir / f"{task.id}.jsonl"
-            transcript_path.write_text(result.stdout)
+            await self._write_transcript(transcript_path, result.stdout)
 
             # 6. Parse result
             summary, stats = self._parse_transcript(result.stdout)
@@ -135,18 +156,22 @@ class CoderComponent(BaseComponent):
                     error=error_msg,
                 )
 
-            # Emit transcript event with stats
-            await self._emit_event(
-                "coder.transcript",
-                {
-                    "task_id": task.id,
-                    "transcript_path": str(transcript_path),
-                    "stats": stats,
-                },
-            )
-            await self._emit_event(
-                "coder.completed",
-                {"task_id": task.id, "summary": summary[:200] if summary else ""},
+            # Emit transcript event with stats, committed together with completion
+            await self._emit_events(
+                [
+                    (
+                        "coder.transcript",
+                        {
+                            "task_id": task.id,
+                            "transcript_path": str(transcript_path),
+                            "stats": stats,
+                        },
+                    ),
+                    (
+                        "coder.completed",
+                        {"task_id": task.id, "summary": summary[:200] if summary else ""},
+                    ),
+                ]
             )
 
             # Extract token metrics for runtime tracking
@@ -180,7 +205,7 @@ class CoderComponent(BaseComponent):
 
     def _build_system_prompt(self, task: Task) -> str:
         """Load coder_system.txt and fill in variables from task.context."""
-        template = (_PROMPT_DIR / "coder_system.txt").read_text()
+        render = load_template("coder_system.txt")
 
         feedback = task.context.get("feedback", "")
         attempt = task.context.get("attempt_number", 1)
@@ -191,7 +216,7 @@ class CoderComponent(BaseComponent):
         else:
             previous_attempts = "This is the first attempt."
 
-        return template.format(
+        return render(
             problem_description=task.context.get("problem_description", ""),
             branch=task.branch,
             worktree_path="/workspace",
@@ -211,16 +236,12 @@ class CoderComponent(BaseComponent):
     # ------------------------------------------------------------------
 
     async def _ensure_image(self, image: str) -> None:
-        """Build the Docker image if it doesn't exist locally."""
-        await self._docker.check_available()
-
-        if await self._docker.image_exists(image):
-            return
+        """Make sure *image* exists, asking Docker once per client and image."""
+        await ensure_image(self._docker, image, _DOCKERFILE_PATH, self._on_image_build)
 
-        await self._emit_event("coder.image_build.started", {"image": image})
-        logger.info("Building Docker image %s (first run)...", image)
-        await self._docker.build_image(_DOCKERFILE_PATH, image)
-        await self._emit_event("coder.image_build.completed", {"image": image})
+    async def _on_image_build(self, stage: str, image: str) -> None:
+        """Emit ``coder.image_build.*`` events around a build this task started."""
+        await self._emit_event(f"coder.image_build.{stage}", {"image": image})
 
     # ------------------------------------------------------------------
     # Transcript parsing
@@ -232,34 +253,33 @@ class CoderComponent(BaseComponent):
 
         Returns (response_text, stats_dict).  Extracts the ``result``
         event for the final response and aggregated stats.  Falls back
-        to concatenating ``message`` events if no ``result`` is found.
+        to the last assistant ``message`` event if no ``result`` is found.
+
+        Lines are scanned from the end and only those that can hold the
+        wanted event are decoded, so a long session costs a couple of
+        ``json.loads`` calls rather than one per event, and the output is
+        never split into a list of lines.
         """
         response_text = ""
         stats: dict = {}
-        messages: list[str] = []
-
-        for line in stdout.strip().splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            event_type = event.get("type", "")
 
-            if event_type == "result":
+        for line in _lines_from_end(stdout):
+            event = _decode_event(line, '"result"')
+            if event is not None and event.get("type") == "result":
                 response_text = event.get("response", "")
                 stats = event.get("stats", {})
-            elif event_type == "message":
-                role = event.get("role", "")
-                content = event.get("content", "")
-                if role == "assistant" and content:
-                    messages.append(content)
-
-        if not response_text and messages:
-            response_text = messages[-1]
+                break
+
+        if not response_text:
+            for line in _lines_from_end(stdout):
+                event = _decode_event(line, '"assistant"')
+                if (
+                    event is not None
+                    and event.get("type") == "message"
+                    and event.get("role") == "assistant"
+                    and event.get("content")
+                ):
+                    return event["content"], stats
 
         return response_text, stats
 
@@ -269,11 +289,14 @@ class CoderComponent(BaseComponent):
 
     async def _emit_event(self, event_type: str, data: dict) -> None:
         """Emit an event to the event log."""
-        await self._event_log.append(
-            Event(
-                seq=self._id_gen.next_event_seq(),
-                type=event_type,
-                timestamp=datetime.datetime.now(datetime.UTC),
-                data=data,
-            )
+        await self._emit_events([(event_type, data)])
+
+    async def _emit_events(self, events: list[tuple[str, dict]]) -> None:
+        """Emit several ``(type, data)`` events with one log write."""
+        now = datetime.datetime.now(datetime.UTC)
+        await self._event_log.append_batch(
+            [
+                Event(seq=self._id_gen.next_event_seq(), type=event_type, timestamp=now, data=data)
+                for event_type, data in events
+            ]
         )
@@ -11,17 +11,24 @@ import asyncio
 import datetime
 import json
 import logging
-import os
-import signal
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
+
 if TYPE_CHECKING:
     from aurelia.core.events import EventLog
     from aurelia.core.ids import IdGenerator
     from aurelia.sandbox.docker import DockerClient
 
 from aurelia.core.models import Event, SandboxConfig, Task, TaskResult
+from aurelia.git.repo import GitRepo
+from aurelia.sandbox.docker import ensure_image, start_image_check
+from aurelia.sandbox.process import communicate_tail, kill_process_group, spawn_command
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,11 @@ _PRESUBMIT_TIMEOUT_S = 120
 _DOCKERFILE_PATH = Path(__file__).parent.parent / "sandbox" / "Dockerfile.evaluator"
 _DEFAULT_IMAGE = "aurelia-evaluator:latest"
 
+# Metrics of past successful evaluations of clean worktrees, most recent last:
+# (HEAD tree hash, eval command, presubmit checks, image or "") -> metrics
+_RESULT_CACHE: OrderedDict[tuple[str, str, tuple[str, ...], str], dict[str, float]] = OrderedDict()
+_RESULT_CACHE_SIZE = 256
+
 
 _DEFAULT_EVAL_COMMAND = "pixi run evaluate"
 
@@ -57,31 +69,48 @@ class EvaluatorComponent:
         self._id_gen = id_generator
         self._sandbox_config = sandbox_config
         self._docker = docker_client
-        self._image_built = False
+        self._pending_events: list[Event] = []
+
+        # Start the image check now so the first sandboxed evaluation does not
+        # wait for a cold build; outside an event loop _ensure_image starts it
+        if docker_client is not None and sandbox_config is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                start_image_check(docker_client, self._image, _DOCKERFILE_PATH)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    async def _emit(self, event_type: str, data: dict[str, object]) -> None:
+    def _emit(self, event_type: str, data: dict[str, object]) -> None:
+        """Queue an event; :meth:`execute` writes the queue once it returns."""
         event = Event(
             seq=self._id_gen.next_event_seq(),
             type=event_type,
             timestamp=datetime.datetime.now(datetime.UTC),
             data=data,
         )
-        await self._event_log.append(event)
+        self._pending_events.append(event)
+
+    async def _flush_events(self) -> None:
+        """Write the queued events to the log with a single append."""
+        events, self._pending_events = self._pending_events, []
+        if events:
+            await self._event_log.append_batch(events)
+
+    @property
+    def _image(self) -> str:
+        """Docker image evaluations run in."""
+        return self._sandbox_config.image if self._sandbox_config else _DEFAULT_IMAGE
 
     async def _ensure_image(self) -> None:
-        """Build Docker image if it doesn't exist."""
-        if self._image_built or self._docker is None:
+        """Wait until the Docker image exists, building it on first use."""
+        if self._docker is None:
             return
-
-        image = self._sandbox_config.image if self._sandbox_config else _DEFAULT_IMAGE
-        if not await self._docker.image_exists(image):
-            logger.info("Building Docker image %s (first run)...", image)
-            await self._docker.build_image(_DOCKERFILE_PATH, image)
-        self._image_built = True
+        await ensure_image(self._docker, self._image, _DOCKERFILE_PATH)
 
     # ------------------------------------------------------------------
     # Public API
@@ -91,8 +120,8 @@ class EvaluatorComponent:
         """Run presubmit checks and evaluation in the worktree.
 
         First runs any presubmit checks (e.g., tests) specified in
-        ``task.context["presubmit_checks"]``. If any check fails, returns
-        immediately with an error.
+        ``task.context["presubmit_checks"]``, all at once. If any check fails,
+        the others are stopped and an error is returned immediately.
 
         Then runs the evaluation command (default ``pixi run evaluate``) in the
         worktree directory specified by ``task.context["worktree_path"]``.
@@ -103,15 +132,45 @@ class EvaluatorComponent:
 
         If sandbox_config was provided, runs in Docker container; otherwise
         uses direct subprocess execution.
+
+        A clean git worktree whose committed content was already evaluated
+        successfully with the same command and checks gets the earlier
+        metrics back without running anything (``eval.cached``).
+
+        Events are queued while the task runs and written with one append
+        on the way out.
         """
+        try:
+            return await self._evaluate(task)
+        finally:
+            await self._flush_events()
+
+    async def _evaluate(self, task: Task) -> TaskResult:
+        """Body of :meth:`execute`; events are only queued here."""
         worktree_path = task.context["worktree_path"]
         eval_command = task.context.get("eval_command", _DEFAULT_EVAL_COMMAND)
         presubmit_checks: list[str] = task.context.get("presubmit_checks", [])
         result_id = self._id_gen.next_id("result")
 
+        # Identical content was already evaluated the same way: reuse its metrics
+        cache_key = await self._result_cache_key(worktree_path, eval_command, presubmit_checks)
+        if cache_key is not None and cache_key in _RESULT_CACHE:
+            _RESULT_CACHE.move_to_end(cache_key)
+            metrics = dict(_RESULT_CACHE[cache_key])
+            self._emit(
+                "eval.cached",
+                {
+                    "task_id": task.id,
+                    "worktree": worktree_path,
+                    "command": eval_command,
+                    "metrics": metrics,
+                },
+            )
+            return TaskResult(id=result_id, summary="Evaluation completed", metrics=metrics)
+
         # Step 1: Run presubmit checks (tests)
         if presubmit_checks:
-            await self._emit(
+            self._emit(
                 "eval.presubmit_started",
                 {
                     "task_id": task.id,
@@ -120,47 +179,34 @@ class EvaluatorComponent:
                 },
             )
 
-            for check in presubmit_checks:
-                exit_code, stdout, stderr = await self._execute_subprocess(
-                    worktree_path, check, timeout_s=_PRESUBMIT_TIMEOUT_S
-                )
-
+            failure = await self._run_presubmit_checks(worktree_path, presubmit_checks)
+            if failure is not None:
+                check, exit_code, stdout, stderr = failure
                 if exit_code == -1:
                     error_msg = f"Presubmit check '{check}' timed out"
-                    await self._emit(
-                        "eval.presubmit_failed",
-                        {"task_id": task.id, "check": check, "error": error_msg},
-                    )
-                    return TaskResult(
-                        id=result_id,
-                        summary=error_msg,
-                        error=error_msg,
-                        metrics={},
-                    )
-
-                if exit_code != 0:
+                else:
                     error_msg = f"Presubmit check '{check}' failed (exit {exit_code})"
                     detail = stderr or stdout
                     if detail:
-                        error_msg += f": {detail[:500]}"
-                    await self._emit(
-                        "eval.presubmit_failed",
-                        {"task_id": task.id, "check": check, "error": error_msg},
-                    )
-                    return TaskResult(
-                        id=result_id,
-                        summary=error_msg,
-                        error=error_msg,
-                        metrics={},
-                    )
-
-            await self._emit(
+                        error_msg += f": {_decode(detail)[-500:]}"
+                self._emit(
+                    "eval.presubmit_failed",
+                    {"task_id": task.id, "check": check, "error": error_msg},
+                )
+                return TaskResult(
+                    id=result_id,
+                    summary=error_msg,
+                    error=error_msg,
+                    metrics={},
+                )
+
+            self._emit(
                 "eval.presubmit_passed",
                 {"task_id": task.id, "checks_passed": len(presubmit_checks)},
             )
 
         # Step 2: Run evaluation
-        await self._emit(
+        self._emit(
             "eval.started",
             {
                 "task_id": task.id,
@@ -184,100 +230,125 @@ class EvaluatorComponent:
                 error=f"Timed out after {_TIMEOUT_S}s",
                 metrics={},
             )
-            await self._emit("eval.failed", {"task_id": task.id, "error": result.error})
+            self._emit("eval.failed", {"task_id": task.id, "error": result.error})
             return result
 
         # Handle non-zero exit
         if exit_code != 0:
-            error_msg = stderr or stdout
+            error_msg = _decode(stderr or stdout)
             result = TaskResult(
                 id=result_id,
                 summary="Evaluation failed",
                 error=error_msg,
                 metrics={},
             )
-            await self._emit("eval.failed", {"task_id": task.id, "error": error_msg})
+            self._emit("eval.failed", {"task_id": task.id, "error": error_msg})
             return result
 
-        # Parse JSON metrics - try full output first, then last line
-        # (evaluate.py may print human-readable summary before JSON)
-        metrics: dict[str, float] = {}
-        try:
-            metrics = json.loads(stdout)
-        except (json.JSONDecodeError, ValueError):
-            # Try parsing just the last non-empty line as JSON
-            for line in reversed(stdout.strip().splitlines()):
-                line = line.strip()
-                if line:
-                    try:
-                        metrics = json.loads(line)
-                        break
-                    except (json.JSONDecodeError, ValueError):
-                        continue
-
-            if not metrics:
-                result = TaskResult(
-                    id=result_id,
-                    summary="Evaluation output not valid JSON",
-                    error=stdout[-500:] if len(stdout) > 500 else stdout,
-                    metrics={},
-                )
-                await self._emit(
-                    "eval.failed", {"task_id": task.id, "error": "invalid JSON output"}
-                )
-                return result
+        # Parse JSON metrics straight from the output bytes - the full output
+        # if it is one object, else the last object line (evaluate.py may
+        # print a human-readable summary before JSON)
+        metrics = _parse_metrics(stdout)
+        if metrics is None:
+            result = TaskResult(
+                id=result_id,
+                summary="Evaluation output not valid JSON",
+                error=_decode(stdout)[-500:],
+                metrics={},
+            )
+            self._emit("eval.failed", {"task_id": task.id, "error": "invalid JSON output"})
+            return result
 
         result = TaskResult(
             id=result_id,
             summary="Evaluation completed",
             metrics=metrics,
         )
-        await self._emit("eval.completed", {"task_id": task.id, "metrics": metrics})
+        if cache_key is not None:
+            _RESULT_CACHE[cache_key] = dict(result.metrics)
+            if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+        self._emit("eval.completed", {"task_id": task.id, "metrics": metrics})
         return result
 
+    async def _result_cache_key(
+        self, worktree_path: str, eval_command: str, presubmit_checks: list[str]
+    ) -> tuple[str, str, tuple[str, ...], str] | None:
+        """Key past results by the worktree's committed content and how it is run.
+
+        Uses the tree hash of HEAD, so reruns and rebases onto the same content
+        share a key. Returns None (no caching) for worktrees with uncommitted
+        or untracked changes, or that are not the top of a git checkout. Changes
+        to gitignored files do not affect the key.
+        """
+        try:
+            tree = await GitRepo(Path(worktree_path)).clean_tree_hash()
+        except (RuntimeError, OSError):
+            return None
+        if tree is None:
+            return None
+        sandboxed = self._sandbox_config is not None and self._docker is not None
+        image = self._sandbox_config.image if sandboxed else ""
+        return tree, eval_command, tuple(presubmit_checks), image
+
+    async def _run_presubmit_checks(
+        self, worktree_path: str, checks: list[str]
+    ) -> tuple[str, int, bytes, bytes] | None:
+        """Run *checks* side by side, stopping at the first one that fails.
+
+        Returns ``(check, exit_code, stdout, stderr)`` for the failing check
+        (the earliest listed if several fail together), or None if all pass.
+        Checks still running at that point are cancelled, which kills their
+        process groups, so checks must not depend on each other's effects.
+        """
+        runs = {
+            asyncio.ensure_future(
+                self._execute_subprocess(worktree_path, check, timeout_s=_PRESUBMIT_TIMEOUT_S)
+            ): check
+            for check in checks
+        }
+        pending = set(runs)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for run, check in runs.items():
+                    if run in done:
+                        exit_code, stdout, stderr = run.result()
+                        if exit_code != 0:
+                            return check, exit_code, stdout, stderr
+            return None
+        finally:
+            for run in pending:
+                run.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _execute_subprocess(
         self,
         worktree_path: str,
         command: str,
         timeout_s: int = _TIMEOUT_S,
-    ) -> tuple[int, str, str]:
-        """Execute a command via direct subprocess.
+    ) -> tuple[int, bytes, bytes]:
+        """Execute a command via direct subprocess, returning raw output bytes.
 
         Uses process groups to ensure all child processes are cleaned up
-        on timeout or cancellation.
+        on timeout or cancellation. Only the tail of each output stream is
+        kept (see :func:`communicate_tail`); metrics JSON comes last.
         """
-        proc = await asyncio.create_subprocess_shell(
-            command,
-            cwd=worktree_path,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            start_new_session=True,  # Create new process group for cleanup
-        )
+        proc = await spawn_command(command, worktree_path)
         try:
             stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                proc.communicate(), timeout=timeout_s
+                communicate_tail(proc), timeout=timeout_s
             )
-            return proc.returncode or 0, stdout_bytes.decode(), stderr_bytes.decode()
+            return proc.returncode or 0, stdout_bytes, stderr_bytes
         except (TimeoutError, asyncio.CancelledError):
             # Kill the entire process group to clean up all children
-            self._kill_process_group(proc.pid)
-            await proc.wait()
-            return -1, "", f"Command timed out after {timeout_s}s or cancelled"
+            await kill_process_group(proc)
+            return -1, b"", f"Command timed out after {timeout_s}s or cancelled".encode()
 
-    def _kill_process_group(self, pid: int) -> None:
-        """Kill a process group, first with SIGTERM then SIGKILL."""
-        try:
-            os.killpg(pid, signal.SIGTERM)
-        except (ProcessLookupError, PermissionError):
-            return
-        # Give processes a moment to terminate gracefully
-        try:
-            os.killpg(pid, signal.SIGKILL)
-        except (ProcessLookupError, PermissionError):
-            pass
-
-    async def _execute_docker(self, worktree_path: str, eval_command: str) -> tuple[int, str, str]:
-        """Execute evaluation in Docker container."""
+    async def _execute_docker(
+        self, worktree_path: str, eval_command: str
+    ) -> tuple[int, bytes, bytes]:
+        """Execute evaluation in Docker container, returning output as bytes."""
         if self._docker is None or self._sandbox_config is None:
             raise RuntimeError("Docker execution requires docker_client and sandbox_config")
 
@@ -295,6 +366,58 @@ class EvaluatorComponent:
                 mounts=[(worktree_path, "/workspace", False)],
                 timeout_s=self._sandbox_config.timeout_s or _TIMEOUT_S,
             )
-            return result.exit_code, result.stdout, result.stderr
+            return result.exit_code, result.stdout.encode(), result.stderr.encode()
         except TimeoutError:
-            return -1, "", "Evaluation timed out in container"
+            return -1, b"", b"Evaluation timed out in container"
+
+
+def _decode(data: bytes) -> str:
+    """Decode process output for messages, replacing invalid UTF-8."""
+    return data.decode(errors="replace")
+
+
+def _loads(data: bytes) -> object:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN metrics, which only the stdlib parser accepts
+    return json.loads(data)
+
+
+def _parse_metrics(stdout: bytes) -> dict | None:
+    """Parse the metrics object from evaluator output, or return None.
+
+    Output that is a single JSON object is parsed whole; anything else goes
+    straight to the trailing-line scan, with no failed full parse first.
+    """
+    body = stdout.strip()
+    if body[:1] == b"{" and body[-1:] == b"}":
+        try:
+            return _loads(body)
+        except ValueError:
+            pass  # e.g. log lines that happen to start and end in braces
+    return _last_json_object(body)
+
+
+def _last_json_object(data: bytes) -> dict | None:
+    """Return the last non-empty JSON object found on a line of its own.
+
+    Lines are walked backwards with rfind, so only the tail of a long log is
+    touched and nothing is split into a list.
+    """
+    end = len(data)
+    while end > 0:
+        start = data.rfind(b"\n", 0, end) + 1
+        line = data[start:end].strip()
+        end = start - 1
+        if not line.startswith(b"{"):
+            continue
+        try:
+            obj = _loads(line)
+        except ValueError:
+            continue
+        if isinstance(obj, dict) and obj:
+            return obj
+    return None
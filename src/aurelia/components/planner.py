@@ -14,16 +14,17 @@ import os
 from pathlib import Path
 
 from aurelia.components.base import BaseComponent
+from aurelia.components.prompts import load_template
 from aurelia.core.events import EventLog
 from aurelia.core.ids import IdGenerator
 from aurelia.core.models import ComponentSpec, Event, Task, TaskResult
 from aurelia.llm.client import LLMClient
-from aurelia.sandbox.docker import DockerClient
+from aurelia.sandbox.docker import DockerClient, ensure_image
 from aurelia.tools.registry import ToolRegistry
 
-_PROMPT_DIR = Path(__file__).parent / "prompts"
 _DOCKERFILE_PATH = Path(__file__).parent.parent / "sandbox" / "Dockerfile"
 
+
 _PLAN_SCHEMA = {
     "type": "object",
     "required": ["summary", "items"],
@@ -161,9 +162,8 @@ class PlannerComponent(BaseComponent):
 
             # 5. Save transcript
             transcript_dir = self._project_dir / ".aurelia" / "logs" / "transcripts"
-            transcript_dir.mkdir(parents=True, exist_ok=True)
             transcript_path = transcript_dir / f"{task.id}.jsonl"
-            transcript_path.write_text(result.stdout)
+            await self._write_transcript(transcript_path, result.stdout)
 
             if result.exit_code != 0:
                 error_msg = (
@@ -211,10 +211,10 @@ class PlannerComponent(BaseComponent):
 
     def _build_system_prompt(self, task: Task) -> str:
         """Load planner system prompt template and fill variables."""
-        template = (_PROMPT_DIR / "planner_system.txt").read_text()
+        render = load_template("planner_system.txt")
         planning_ctx = task.context.get("planning_context", {})
         problem_desc = task.context.get("problem_description", "")
-        return template.format(
+        return render(
             problem_description=problem_desc,
             planning_context=self._build_context_markdown(problem_desc, planning_ctx),
             plan_schema=json.dumps(_PLAN_SCHEMA, indent=2),
@@ -255,14 +255,12 @@ class PlannerComponent(BaseComponent):
         return "\n".join(sections)
 
     async def _ensure_image(self, image: str) -> None:
-        """Build the Docker image if it doesn't exist locally."""
-        await self._docker.check_available()
-        if await self._docker.image_exists(image):
-            return
-        await self._emit_event("planner.image_build.started", {"image": image})
-        logger.info("Building Docker image %s (first run)...", image)
-        await self._docker.build_image(_DOCKERFILE_PATH, image)
-        await self._emit_event("planner.image_build.completed", {"image": image})
+        """Make sure *image* exists, asking Docker once per client and image."""
+        await ensure_image(self._docker, image, _DOCKERFILE_PATH, self._on_image_build)
+
+    async def _on_image_build(self, stage: str, image: str) -> None:
+        """Emit ``planner.image_build.*`` events around a build this task started."""
+        await self._emit_event(f"planner.image_build.{stage}", {"image": image})
 
     async def _emit_event(self, event_type: str, data: dict) -> None:
         """Emit an event to the event log."""
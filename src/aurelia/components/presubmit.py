@@ -5,8 +5,6 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
-import os
-import signal
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,6 +12,7 @@ if TYPE_CHECKING:
     from aurelia.core.ids import IdGenerator
 
 from aurelia.core.models import Event, Task, TaskResult
+from aurelia.sandbox.process import communicate_tail, kill_process_group, spawn_command
 
 logger = logging.getLogger(__name__)
 
@@ -46,18 +45,6 @@ class PresubmitComponent:
         )
         await self._event_log.append(event)
 
-    def _kill_process_group(self, pid: int) -> None:
-        """Kill a process group, first with SIGTERM then SIGKILL."""
-        try:
-            os.killpg(pid, signal.SIGTERM)
-        except (ProcessLookupError, PermissionError):
-            return
-        # Give processes a moment to terminate gracefully
-        try:
-            os.killpg(pid, signal.SIGKILL)
-        except (ProcessLookupError, PermissionError):
-            pass
-
     async def execute(self, task: Task) -> TaskResult:
         """Run presubmit checks in the candidate worktree.
 
@@ -82,21 +69,14 @@ class PresubmitComponent:
         outputs: list[str] = []
 
         for check in checks:
-            proc = await asyncio.create_subprocess_shell(
-                check,
-                cwd=worktree_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                start_new_session=True,  # Create new process group for cleanup
-            )
+            proc = await spawn_command(check, worktree_path)
             try:
                 stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(), timeout=_TIMEOUT_S
+                    communicate_tail(proc), timeout=_TIMEOUT_S
                 )
             except (TimeoutError, asyncio.CancelledError):
                 # Kill the entire process group to clean up all children
-                self._kill_process_group(proc.pid)
-                await proc.wait()
+                await kill_process_group(proc)
                 error_msg = f"Check '{check}' timed out after {_TIMEOUT_S}s"
                 result = TaskResult(
                     id=result_id,
@@ -113,14 +93,14 @@ class PresubmitComponent:
                 )
                 return result
 
-            stdout = stdout_bytes.decode()
-            stderr = stderr_bytes.decode()
+            stdout = stdout_bytes.decode(errors="replace")
+            stderr = stderr_bytes.decode(errors="replace")
 
             if proc.returncode != 0:
                 error_msg = f"Check '{check}' failed (exit {proc.returncode})"
                 detail = stderr or stdout
                 if detail:
-                    error_msg += f": {detail[:500]}"
+                    error_msg += f": {detail[-500:]}"
                 result = TaskResult(
                     id=result_id,
                     summary=error_msg,
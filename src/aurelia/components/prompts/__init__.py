@@ -0,0 +1,38 @@
+"""System prompt templates for the components."""
+
+from __future__ import annotations
+
+import string
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+
+_PROMPT_DIR = Path(__file__).parent
+
+
+@cache
+def load_template(name: str) -> Callable[..., str]:
+    """Return a renderer for the template file *name*, read and parsed once.
+
+    The renderer takes the template fields as keyword arguments and returns
+    what ``template.format(**fields)`` would.  Plain ``{field}`` templates
+    are split into literal segments up front, so rendering is a single join;
+    anything fancier (format specs, conversions, indexing) uses ``format``.
+    """
+    text = (_PROMPT_DIR / name).read_text()
+    segments = list(string.Formatter().parse(text))
+    if any(
+        spec or conversion or (field is not None and not field.isidentifier())
+        for _, field, spec, conversion in segments
+    ):
+        return text.format
+
+    def render(**fields: object) -> str:
+        return "".join(
+            [
+                literal if field is None else literal + format(fields[field])
+                for literal, field, _, _ in segments
+            ]
+        )
+
+    return render
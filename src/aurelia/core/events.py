@@ -35,13 +35,19 @@ class EventLog:
 
     async def append(self, event: Event) -> None:
         """Serialize *event* to JSON, append as a single line, and fsync."""
+        await self.append_batch([event])
+
+    async def append_batch(self, events: list[Event]) -> None:
+        """Append *events* in order with a single write and one fsync."""
+        if not events:
+            return
+        data = "".join(event.model_dump_json() + "\n" for event in events).encode()
 
         def _write() -> None:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            line = event.model_dump_json() + "\n"
             fd = os.open(str(self._path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
             try:
-                os.write(fd, line.encode())
+                os.write(fd, data)
                 os.fsync(fd)
             finally:
                 os.close(fd)
@@ -380,4 +380,5 @@ class ToolRegistration(BaseModel):
     description: str
     input_schema: dict[str, Any]
     requires_sandbox: bool = False
+    read_only: bool = False
     handler: str = ""
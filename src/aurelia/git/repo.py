@@ -195,6 +195,28 @@ class GitRepo:
             return data
         return [data]
 
+    # ------------------------------------------------------------------
+    # Working tree state
+    # ------------------------------------------------------------------
+
+    async def clean_tree_hash(self) -> str | None:
+        """Return the tree hash of HEAD if the working tree matches it exactly.
+
+        Returns None when there are staged, unstaged or untracked changes, or
+        when :attr:`project_dir` is not the top level of its checkout. Files
+        matched by ``.gitignore`` are not considered, so a tree that differs
+        from HEAD only in ignored files still counts as clean.
+        """
+        status, rev = await asyncio.gather(
+            self._run("status", "--porcelain", "--untracked-files=all"),
+            self._run("rev-parse", "--show-prefix", "HEAD^{tree}"),
+        )
+        # A non-empty prefix line means the path is inside some other checkout
+        prefix, _, tree = rev.rpartition("\n")
+        if status or prefix:
+            return None
+        return tree
+
     # ------------------------------------------------------------------
     # Show
     # ------------------------------------------------------------------
@@ -2,19 +2,27 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections import OrderedDict
 from pathlib import Path
 
 import anyio.to_thread
 
 
 class LLMCache:
-    """LLM response cache for deterministic replay."""
+    """LLM response cache for deterministic replay.
 
-    def __init__(self, cache_dir: Path) -> None:
+    Entries are kept in an in-memory LRU of *max_entries* responses and,
+    when *cache_dir* is given, mirrored to one JSON file per request hash
+    so they survive restarts.
+    """
+
+    def __init__(self, cache_dir: Path | None, max_entries: int = 256) -> None:
         self._cache_dir = cache_dir
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, dict] = OrderedDict()
 
+    @staticmethod
     def request_hash(
-        self,
         model: str,
         contents: list,
         config: dict,
@@ -29,6 +37,13 @@ class LLMCache:
 
     async def lookup(self, request_hash: str) -> dict | None:
         """Look up a cached response by request hash. Returns None on miss."""
+        response = self._memory.get(request_hash)
+        if response is not None:
+            self._memory.move_to_end(request_hash)
+            return response
+        if self._cache_dir is None:
+            return None
+
         path = self._cache_dir / f"{request_hash}.json"
 
         def _read() -> dict | None:
@@ -39,7 +54,10 @@ class LLMCache:
         entry = await anyio.to_thread.run_sync(_read)
         if entry is None:
             return None
-        return entry.get("response")
+        response = entry.get("response")
+        if response is not None:
+            self._remember(request_hash, response)
+        return response
 
     async def store(
         self,
@@ -48,6 +66,10 @@ class LLMCache:
         metadata: dict,
     ) -> None:
         """Store a response in the cache."""
+        self._remember(request_hash, response)
+        if self._cache_dir is None:
+            return
+
         path = self._cache_dir / f"{request_hash}.json"
         entry = json.dumps(
             {
@@ -64,3 +86,10 @@ class LLMCache:
             path.write_text(entry, encoding="utf-8")
 
         await anyio.to_thread.run_sync(_write)
+
+    def _remember(self, request_hash: str, response: dict) -> None:
+        """Insert *response* into the memory LRU, evicting the oldest entry."""
+        self._memory[request_hash] = response
+        self._memory.move_to_end(request_hash)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
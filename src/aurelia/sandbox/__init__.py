@@ -5,6 +5,14 @@ from aurelia.sandbox.docker import (
     DockerClient,
     DockerNotAvailableError,
     ImageBuildError,
+    ensure_image,
+    start_image_check,
+)
+from aurelia.sandbox.process import (
+    command_argv,
+    communicate_tail,
+    kill_process_group,
+    spawn_command,
 )
 
 __all__ = [
@@ -12,4 +20,10 @@ __all__ = [
     "DockerClient",
     "DockerNotAvailableError",
     "ImageBuildError",
+    "command_argv",
+    "ensure_image",
+    "start_image_check",
+    "communicate_tail",
+    "kill_process_group",
+    "spawn_command",
 ]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,6 +13,13 @@ from aurelia.core.models import SandboxConfig
 
 logger = logging.getLogger(__name__)
 
+# Image checks per Docker client, shared by every component, so a long-running
+# process asks Docker once per image rather than once per task:
+# client -> {image: check}
+_IMAGE_CHECKS: weakref.WeakKeyDictionary[DockerClient, dict[str, asyncio.Future[None]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class DockerNotAvailableError(RuntimeError):
     """Raised when Docker daemon is not reachable."""
@@ -174,3 +183,69 @@ class DockerClient:
             stdout_bytes.decode(errors="replace"),
             stderr_bytes.decode(errors="replace"),
         )
+
+
+def start_image_check(
+    client: DockerClient,
+    image: str,
+    dockerfile_path: Path,
+    on_build: Callable[[str, str], Awaitable[None]] | None = None,
+) -> asyncio.Future[None]:
+    """Return the shared check (and build) of *image*, starting it if needed.
+
+    The first caller for a client and image starts the check; later callers
+    get the same future. A failed or cancelled check is forgotten so the next
+    caller tries again. *on_build* is awaited with ``("started", image)``
+    and ``("completed", image)`` around a build, so the component that
+    started the check can emit its own events.
+    Must be called with a running event loop.
+    """
+    checks = _IMAGE_CHECKS.setdefault(client, {})
+    check = checks.get(image)
+    if check is None:
+        check = checks[image] = asyncio.ensure_future(
+            _check_or_build_image(client, image, dockerfile_path, on_build)
+        )
+
+        def _forget_failure(done: asyncio.Future[None]) -> None:
+            if done.cancelled() or done.exception() is not None:
+                checks.pop(image, None)
+
+        check.add_done_callback(_forget_failure)
+    return check
+
+
+async def ensure_image(
+    client: DockerClient,
+    image: str,
+    dockerfile_path: Path,
+    on_build: Callable[[str, str], Awaitable[None]] | None = None,
+) -> None:
+    """Make sure *image* exists, building it from *dockerfile_path* if missing.
+
+    Docker is asked once per client and image; concurrent callers share the
+    first caller's check (see :func:`start_image_check`).
+    """
+    check = start_image_check(client, image, dockerfile_path, on_build)
+    if check.done() and not check.cancelled() and check.exception() is None:
+        return
+    await asyncio.shield(check)
+
+
+async def _check_or_build_image(
+    client: DockerClient,
+    image: str,
+    dockerfile_path: Path,
+    on_build: Callable[[str, str], Awaitable[None]] | None,
+) -> None:
+    """Build *image* unless it already exists locally."""
+    await client.check_available()
+    if await client.image_exists(image):
+        return
+
+    if on_build is not None:
+        await on_build("started", image)
+    logger.info("Building Docker image %s (first run)...", image)
+    await client.build_image(dockerfile_path, image)
+    if on_build is not None:
+        await on_build("completed", image)
@@ -0,0 +1,122 @@
+"""Host subprocess helpers for running project commands outside a container."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import shlex
+import signal
+from collections import deque
+
+# Characters that only mean something to a shell; any of them sends the
+# command through /bin/sh rather than exec'ing it directly
+_SHELL_SYNTAX = frozenset("|&;<>()$`\\*?[]{}~#\n")
+_SHELL_BUILTINS = frozenset(
+    {".", "alias", "cd", "eval", "exec", "export", "set", "source", "ulimit", "umask", "unset"}
+)
+
+# Bytes kept from the end of each output stream, read a chunk at a time;
+# anything earlier is replaced by _TRUNCATED_MARKER
+_OUTPUT_TAIL_BYTES = 1 << 20
+_READ_CHUNK_BYTES = 1 << 16
+_TRUNCATED_MARKER = b"...[truncated]...\n"
+
+# Seconds a process group gets to exit after SIGTERM before it is SIGKILLed
+_KILL_GRACE_S = 2.0
+
+
+def command_argv(command: str) -> list[str] | None:
+    """Split *command* into an argv, or return None if it needs a shell.
+
+    Only plain words and quoting are handled here; redirections, pipes,
+    expansions, globs, variable assignments and builtins are left to the shell.
+    """
+    if not _SHELL_SYNTAX.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0] or argv[0] in _SHELL_BUILTINS:
+        return None
+    return argv
+
+
+async def spawn_command(command: str, cwd: str) -> asyncio.subprocess.Process:
+    """Start *command* in *cwd* in a new session, with stdout and stderr piped.
+
+    Simple commands are exec'd directly, saving the intermediate shell
+    process; anything else, or any command whose exec fails, runs under
+    ``/bin/sh`` so it behaves and fails exactly as it would from a shell.
+    """
+    argv = command_argv(command)
+    if argv is not None:
+        try:
+            return await asyncio.create_subprocess_exec(
+                *argv,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,  # Create new process group for cleanup
+            )
+        except OSError:
+            # Let the shell handle it: it runs scripts without a shebang
+            # (ENOEXEC) and reports real failures, e.g. "not found" with exit 127
+            pass
+    return await asyncio.create_subprocess_shell(
+        command,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,  # Create new process group for cleanup
+    )
+
+
+async def kill_process_group(proc: asyncio.subprocess.Process, grace: float | None = None) -> None:
+    """Stop the process group led by *proc* and wait for the leader to exit.
+
+    The group gets SIGTERM and up to *grace* seconds to shut down cleanly,
+    then SIGKILL takes out anything still running, including children that
+    outlived a leader which exited on SIGTERM.
+    """
+    if grace is None:
+        grace = _KILL_GRACE_S
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(proc.pid, signal.SIGTERM)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(proc.wait(), timeout=grace)
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(proc.pid, signal.SIGKILL)
+    await proc.wait()
+
+
+async def communicate_tail(proc: asyncio.subprocess.Process) -> tuple[bytes, bytes]:
+    """Like :meth:`Process.communicate`, but with bounded memory.
+
+    Both pipes are drained side by side and only the last
+    ``_OUTPUT_TAIL_BYTES`` of each are kept; a stream that was cut short
+    starts with ``_TRUNCATED_MARKER``. Waits for the process to exit.
+    """
+    stdout, stderr = await asyncio.gather(_read_tail(proc.stdout), _read_tail(proc.stderr))
+    await proc.wait()
+    return stdout, stderr
+
+
+async def _read_tail(stream: asyncio.StreamReader) -> bytes:
+    """Read *stream* to EOF, keeping at most its last ``_OUTPUT_TAIL_BYTES``."""
+    max_bytes = _OUTPUT_TAIL_BYTES
+    chunks: deque[bytes] = deque()
+    size = 0
+    truncated = False
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        chunks.append(chunk)
+        size += len(chunk)
+        # Drop whole chunks from the front while the rest still covers the tail
+        while size - len(chunks[0]) >= max_bytes:
+            size -= len(chunks.popleft())
+            truncated = True
+    tail = b"".join(chunks)
+    if truncated or size > max_bytes:
+        return _TRUNCATED_MARKER + tail[-max_bytes:]
+    return tail
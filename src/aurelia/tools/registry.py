@@ -6,6 +6,9 @@ from typing import Any
 
 from aurelia.core.models import ToolRegistration
 
+# Built-in tools without side effects; calls to them may run concurrently
+_READ_ONLY_BUILTINS = frozenset({"read_file"})
+
 
 class ToolRegistry:
     """Manages MCP tool registrations and dispatches execution requests."""
@@ -24,6 +27,7 @@ class ToolRegistry:
                 description=tool.description or "",
                 input_schema=tool.parameters,
                 requires_sandbox=False,
+                read_only=tool.name in _READ_ONLY_BUILTINS,
                 handler="builtin",
             )
             self._tools[tool.name] = registration
@@ -51,6 +55,11 @@ class ToolRegistry:
             )
         return declarations
 
+    def is_read_only(self, name: str) -> bool:
+        """Return whether *name* is a registered tool without side effects."""
+        reg = self._tools.get(name)
+        return reg is not None and reg.read_only
+
     async def execute(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool by name with given arguments.
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
+import pytest
+
+from aurelia.components import prompts
 from aurelia.components.coder import CoderComponent
+from aurelia.components.prompts import load_template
 from aurelia.core.events import EventLog
 from aurelia.core.ids import IdGenerator
 from aurelia.core.models import (
@@ -19,7 +24,7 @@ from aurelia.core.models import (
     TaskStatus,
 )
 from aurelia.llm.client import MockLLMClient
-from aurelia.sandbox.docker import ContainerResult, DockerClient
+from aurelia.sandbox.docker import ContainerResult, DockerClient, DockerNotAvailableError
 from aurelia.tools.registry import ToolRegistry
 
 
@@ -331,6 +336,46 @@ class TestCoderLazyImageBuild:
 
         docker.build_image.assert_not_called()
 
+    async def test_image_checked_once_per_docker_client(self, tmp_path):
+        docker = _mock_docker(image_exists=False)
+        components = [
+            CoderComponent(
+                spec=_make_spec(),
+                llm_client=MockLLMClient(),
+                tool_registry=ToolRegistry(),
+                event_log=EventLog(tmp_path / "events.jsonl"),
+                id_generator=IdGenerator(RuntimeState()),
+                project_dir=tmp_path,
+                docker_client=docker,
+            )
+            for _ in range(3)
+        ]
+
+        await asyncio.gather(*(c._ensure_image("aurelia-coder:latest") for c in components))
+        await components[0]._ensure_image("aurelia-coder:latest")
+
+        docker.check_available.assert_called_once()
+        docker.build_image.assert_called_once()
+
+    async def test_failed_image_check_retried(self, tmp_path):
+        docker = _mock_docker()
+        docker.check_available.side_effect = [DockerNotAvailableError("down"), None]
+        component = CoderComponent(
+            spec=_make_spec(),
+            llm_client=MockLLMClient(),
+            tool_registry=ToolRegistry(),
+            event_log=EventLog(tmp_path / "events.jsonl"),
+            id_generator=IdGenerator(RuntimeState()),
+            project_dir=tmp_path,
+            docker_client=docker,
+        )
+
+        with pytest.raises(DockerNotAvailableError):
+            await component._ensure_image("aurelia-coder:latest")
+        await component._ensure_image("aurelia-coder:latest")
+
+        assert docker.check_available.call_count == 2
+
 
 class TestCoderEventsEmitted:
     async def test_events_emitted_on_success(self, tmp_path):
@@ -423,6 +468,29 @@ class TestParseTranscript:
         text, stats = CoderComponent._parse_transcript("\n".join(lines))
         assert text == "ok"
 
+    def test_parse_keeps_unicode_line_separators_in_strings(self):
+        stdout = json.dumps(
+            {"type": "result", "response": "one\u2028two", "stats": {}}, ensure_ascii=False
+        )
+        text, _ = CoderComponent._parse_transcript(stdout + "\n")
+        assert text == "one\u2028two"
+
+    def test_parse_last_result_wins(self):
+        lines = [
+            json.dumps({"type": "result", "response": "old", "stats": {"n": 1}}),
+            json.dumps({"type": "message", "role": "assistant", "content": "between"}),
+            json.dumps({"type": "result", "response": "new", "stats": {"n": 2}}),
+        ]
+        assert CoderComponent._parse_transcript("\n".join(lines)) == ("new", {"n": 2})
+
+    def test_parse_empty_result_falls_back_to_message_keeps_stats(self):
+        lines = [
+            json.dumps({"type": "message", "role": "assistant", "content": "answer"}),
+            json.dumps({"type": "message", "role": "user", "content": "result"}),
+            json.dumps({"type": "result", "response": "", "stats": {"n": 3}}),
+        ]
+        assert CoderComponent._parse_transcript("\n".join(lines)) == ("answer", {"n": 3})
+
 
 class TestCoderForwardsApiKeys:
     async def test_forwards_env_vars_to_container(self, tmp_path, monkeypatch):
@@ -516,3 +584,34 @@ class TestCoderFeedbackInPrompt:
         # No feedback in context
         prompt = component._build_system_prompt(task)
         assert "first attempt" in prompt.lower()
+
+    async def test_template_read_once(self, tmp_path):
+        component = CoderComponent(
+            spec=_make_spec(),
+            llm_client=MockLLMClient(),
+            tool_registry=ToolRegistry(),
+            event_log=EventLog(tmp_path / "events.jsonl"),
+            id_generator=IdGenerator(RuntimeState()),
+            project_dir=tmp_path,
+        )
+        task = _make_task(str(tmp_path))
+
+        load_template.cache_clear()
+        read_text = Path.read_text
+        with patch.object(Path, "read_text", autospec=True, side_effect=read_text) as mock_read:
+            first = component._build_system_prompt(task)
+            second = component._build_system_prompt(task)
+
+        assert first == second
+        assert mock_read.call_count == 1
+
+    def test_rendered_prompt_matches_str_format(self):
+        text = (Path(prompts.__file__).parent / "coder_system.txt").read_text()
+        fields = {
+            "problem_description": "Sort {fast}",
+            "branch": "aurelia/cand-0001",
+            "worktree_path": "/workspace",
+            "instruction": "Use 100% less memory",
+            "previous_attempts": "This is the first attempt.",
+        }
+        assert load_template("coder_system.txt")(**fields) == text.format(**fields)
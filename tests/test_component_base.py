@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import gc
+from unittest.mock import AsyncMock, patch
 
-from google.genai import types
+import httpx
+import pytest
+from google.genai import errors, types
 
 from aurelia.components.base import BaseComponent
 from aurelia.core.events import EventLog
@@ -16,6 +21,7 @@ from aurelia.core.models import (
     TaskStatus,
     ToolRegistration,
 )
+from aurelia.llm.cache import LLMCache
 from aurelia.llm.client import MockLLMClient
 from aurelia.tools.registry import ToolRegistry
 
@@ -158,6 +164,24 @@ class TestToolErrorReturnsDict:
         assert isinstance(result["error"], str)
 
 
+class _FlakyLLMClient(MockLLMClient):
+    """Fails the first call with *error*, then behaves normally."""
+
+    def __init__(
+        self, responses: list[types.Content], error: Exception = ConnectionError("reset")
+    ) -> None:
+        super().__init__(responses)
+        self.error: Exception | None = error
+        self.attempts = 0
+
+    async def generate(self, model, contents, config=None):
+        self.attempts += 1
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        return await super().generate(model, contents, config)
+
+
 class TestLLMEventsEmitted:
     async def test_llm_events_emitted(self, tmp_path):
         event_log = EventLog(tmp_path / "events.jsonl")
@@ -172,15 +196,386 @@ class TestLLMEventsEmitted:
         await component.execute(task)
 
         events = await event_log.read_all()
-        event_types = [e.type for e in events]
-        assert "llm.request" in event_types
-        assert "llm.response" in event_types
+        assert [e.type for e in events] == ["llm.call"]
 
         # Verify event data contains expected fields
-        req_event = next(e for e in events if e.type == "llm.request")
-        assert req_event.data["task_id"] == "task-0001"
-        assert req_event.data["component"] == "test"
+        call_event = events[0]
+        assert call_event.data["task_id"] == "task-0001"
+        assert call_event.data["component"] == "test"
+        assert call_event.data["attempt"] == 1
+        assert "latency_ms" in call_event.data
+
+    async def test_failed_attempt_emits_call_failed(self, tmp_path):
+        event_log = EventLog(tmp_path / "events.jsonl")
+        mock_llm = _FlakyLLMClient(responses=[_text_content("second time lucky")])
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=[])
+        component = BaseComponent(
+            spec, mock_llm, ToolRegistry(), event_log, IdGenerator(RuntimeState())
+        )
+
+        with patch("aurelia.components.base.asyncio.sleep", AsyncMock()):
+            result = await component.execute(_make_task("Flaky"))
+
+        assert result.summary == "second time lucky"
+        events = await event_log.read_all()
+        assert [(e.type, e.data["attempt"]) for e in events] == [
+            ("llm.call_failed", 1),
+            ("llm.call", 2),
+        ]
+        assert events[0].data["error"] == "reset"
+
+
+class TestLLMResponseCache:
+    async def test_identical_request_served_from_cache(self, tmp_path):
+        event_log = EventLog(tmp_path / "events.jsonl")
+        id_gen = IdGenerator(RuntimeState())
+        registry = _make_registry_with_tools()
+
+        mock_llm = MockLLMClient(responses=[_text_content("cached answer")])
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=["read_file"])
+        component = BaseComponent(
+            spec, mock_llm, registry, event_log, id_gen, llm_cache=LLMCache(None)
+        )
+
+        first = await component.execute(_make_task("Same question"))
+        second = await component.execute(_make_task("Same question"))
+
+        assert first.summary == second.summary == "cached answer"
+        assert len(mock_llm.calls) == 1
+
+        responses = [e for e in await event_log.read_all() if e.type == "llm.call"]
+        assert [e.data.get("cached", False) for e in responses] == [False, True]
+        assert responses[1].data["latency_ms"] == 0
+
+    async def test_tool_call_responses_not_cached(self, tmp_path):
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("content")
+
+        event_log = EventLog(tmp_path / "events.jsonl")
+        id_gen = IdGenerator(RuntimeState())
+        registry = _make_registry_with_tools()
+
+        mock_llm = MockLLMClient(responses=[_fc_content("read_file", {"path": str(test_file)})])
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=["read_file"])
+        component = BaseComponent(
+            spec, mock_llm, registry, event_log, id_gen, llm_cache=LLMCache(None)
+        )
+
+        task = _make_task("Read it")
+        config = types.GenerateContentConfig(temperature=0.0)
+        await component._call_llm(task, component._build_contents(task), config)
+        await component._call_llm(task, component._build_contents(task), config)
+
+        assert len(mock_llm.calls) == 2
+
+    async def test_nonzero_temperature_bypasses_cache(self, tmp_path):
+        event_log = EventLog(tmp_path / "events.jsonl")
+        id_gen = IdGenerator(RuntimeState())
+        registry = _make_registry_with_tools()
+
+        mock_llm = MockLLMClient(responses=[_text_content("sampled")])
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=[])
+        component = BaseComponent(
+            spec, mock_llm, registry, event_log, id_gen, llm_cache=LLMCache(None)
+        )
+
+        task = _make_task("Be creative")
+        config = types.GenerateContentConfig(temperature=0.7)
+        await component._call_llm(task, component._build_contents(task), config)
+        await component._call_llm(task, component._build_contents(task), config)
+
+        assert len(mock_llm.calls) == 2
+
+
+class TestHashContents:
+    def _component(self, tmp_path) -> BaseComponent:
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=[])
+        return BaseComponent(
+            spec,
+            MockLLMClient(),
+            ToolRegistry(),
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+        )
+
+    def test_equal_conversations_equal_digest(self, tmp_path):
+        def conversation() -> list[types.Content]:
+            return [
+                types.Content(parts=[types.Part(text="question")], role="user"),
+                _fc_content("read_file", {"path": "/tmp/x"}),
+            ]
+
+        component = self._component(tmp_path)
+        contents = conversation()
+        digest = component._hash_contents(contents)
+        assert component._hash_contents(contents) == digest
+        assert self._component(tmp_path)._hash_contents(conversation()) == digest
+
+    def test_digests_forgotten_with_their_content(self, tmp_path):
+        component = self._component(tmp_path)
+        contents = [
+            types.Content(parts=[types.Part(text=f"turn {i}")], role="user") for i in range(3)
+        ]
+        component._hash_contents(contents)
+        assert len(component._content_digests) == 3
+
+        del contents
+        gc.collect()
+
+        assert component._content_digests == {}
+
+    def test_every_part_field_counts(self, tmp_path):
+        component = self._component(tmp_path)
+        variants = [
+            types.Content(parts=[types.Part(text="a")], role="user"),
+            types.Content(parts=[types.Part(text="a")], role="model"),
+            types.Content(parts=[types.Part(text="a"), types.Part(text="")], role="user"),
+            types.Content(
+                parts=[types.Part.from_bytes(data=b"\x00\x01", mime_type="image/png")],
+                role="user",
+            ),
+            types.Content(
+                parts=[types.Part.from_bytes(data=b"\x00\x02", mime_type="image/png")],
+                role="user",
+            ),
+            _fc_content("read_file", {"path": "/tmp/x"}),
+            _fc_content("read_file", {"path": "/tmp/y"}),
+        ]
+        digests = {component._hash_contents([c]) for c in variants}
+        assert len(digests) == len(variants)
+
+    def test_appended_turn_changes_digest(self, tmp_path):
+        component = self._component(tmp_path)
+        contents = [types.Content(parts=[types.Part(text="question")], role="user")]
+        before = component._hash_contents(contents)
+        contents.append(_text_content("answer"))
+        assert component._hash_contents(contents) != before
+
+
+class _TrackingRegistry(ToolRegistry):
+    """Registry whose tools record how many calls overlap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        for name, read_only in (("look", True), ("edit", False)):
+            self._tools[name] = ToolRegistration(
+                name=name, description="", input_schema={}, read_only=read_only
+            )
+        self.active = 0
+        self.max_active = 0
+        self.finished: list[int] = []
+
+    async def execute(self, name, args):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01 * (3 - args["id"] % 3))
+        self.active -= 1
+        self.finished.append(args["id"])
+        return {"id": args["id"]}
+
+
+class TestParallelToolCalls:
+    async def test_read_only_calls_overlap_and_keep_order(self, tmp_path):
+        calls = [("look", 0), ("look", 1), ("edit", 2), ("look", 3)]
+        round_one = types.Content(
+            parts=[
+                types.Part(function_call=types.FunctionCall(name=name, args={"id": i}))
+                for name, i in calls
+            ],
+            role="model",
+        )
+        mock_llm = MockLLMClient(responses=[round_one, _text_content("done")])
+        registry = _TrackingRegistry()
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=[])
+        component = BaseComponent(
+            spec,
+            mock_llm,
+            registry,
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+        )
+
+        task = _make_task("Look around")
+        contents = component._build_contents(task)
+        await component._tool_use_loop(task, contents, types.GenerateContentConfig())
+
+        assert registry.max_active == 2
+        # The edit only starts once both earlier looks have finished
+        assert registry.finished.index(2) == 2
+        replies = [p.function_response.response["id"] for p in contents[2].parts]
+        assert replies == [0, 1, 2, 3]
+
+
+class TestToolDeclarationsCached:
+    async def test_declarations_built_once_per_component(self, tmp_path):
+        registry = _make_registry_with_tools()
+        mock_llm = MockLLMClient(responses=[_text_content("ok")])
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=["read_file"])
+        component = BaseComponent(
+            spec,
+            mock_llm,
+            registry,
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+        )
+
+        with patch.object(registry, "get_declarations", wraps=registry.get_declarations) as decls:
+            await component.execute(_make_task("one"))
+            await component.execute(_make_task("two"))
+
+        assert decls.call_count == 1
+        tool_names = [
+            [d.name for d in call["config"].tools[0].function_declarations]
+            for call in mock_llm.calls
+        ]
+        assert tool_names == [["read_file"], ["read_file"]]
+
+
+class _SlowLLMClient(MockLLMClient):
+    async def generate(self, model, contents, config=None):
+        await asyncio.sleep(0.05)
+        return await super().generate(model, contents, config)
+
+
+class TestInflightCoalescing:
+    def _component(self, tmp_path, llm) -> BaseComponent:
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=[])
+        return BaseComponent(
+            spec,
+            llm,
+            ToolRegistry(),
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+        )
+
+    async def test_identical_concurrent_calls_share_one_request(self, tmp_path):
+        llm = _SlowLLMClient(responses=[_text_content("shared")])
+        first, second = self._component(tmp_path, llm), self._component(tmp_path, llm)
+        task = _make_task("Same prompt")
+        config = types.GenerateContentConfig(temperature=0.0)
+
+        responses = await asyncio.gather(
+            first._call_llm(task, first._build_contents(task), config),
+            second._call_llm(task, second._build_contents(task), config),
+        )
+
+        assert len(llm.calls) == 1
+        assert [r.text for r in responses] == ["shared", "shared"]
+        assert BaseComponent._inflight == {}
+        events = await EventLog(tmp_path / "events.jsonl").read_all()
+        coalesced = [e for e in events if e.type == "llm.call" and e.data.get("coalesced")]
+        assert len(coalesced) == 1
+
+    async def test_waiter_takes_over_when_leader_cancelled(self, tmp_path):
+        llm = _SlowLLMClient(responses=[_text_content("retried")])
+        first, second = self._component(tmp_path, llm), self._component(tmp_path, llm)
+        task = _make_task("Same prompt")
+        config = types.GenerateContentConfig(temperature=0.0)
+
+        leader = asyncio.create_task(first._call_llm(task, first._build_contents(task), config))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(second._call_llm(task, second._build_contents(task), config))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        response = await waiter
+        assert response.text == "retried"
+        assert leader.cancelled()
+        assert len(llm.calls) == 1
+        assert BaseComponent._inflight == {}
+
+    async def test_different_config_not_coalesced(self, tmp_path):
+        llm = _SlowLLMClient(responses=[_text_content("a")])
+        component = self._component(tmp_path, llm)
+        task = _make_task("Same prompt")
+
+        await asyncio.gather(
+            component._call_llm(
+                task,
+                component._build_contents(task),
+                types.GenerateContentConfig(temperature=0.0, system_instruction="one"),
+            ),
+            component._call_llm(
+                task,
+                component._build_contents(task),
+                types.GenerateContentConfig(temperature=0.0, system_instruction="two"),
+            ),
+        )
+
+        assert len(llm.calls) == 2
+
+
+class TestRetryPolicy:
+    def _component(self, tmp_path, llm) -> BaseComponent:
+        spec = ComponentSpec(id="test", name="Test", role="test", tools=[])
+        return BaseComponent(
+            spec,
+            llm,
+            ToolRegistry(),
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+        )
 
-        resp_event = next(e for e in events if e.type == "llm.response")
-        assert resp_event.data["task_id"] == "task-0001"
-        assert "latency_ms" in resp_event.data
+    async def test_client_error_not_retried(self, tmp_path):
+        error = errors.ClientError(401, {"error": {"message": "bad key"}})
+        llm = _FlakyLLMClient([_text_content("never")], error=error)
+        component = self._component(tmp_path, llm)
+
+        with (
+            patch("aurelia.components.base.asyncio.sleep", AsyncMock()) as sleep,
+            pytest.raises(RuntimeError, match="non-retryable") as excinfo,
+        ):
+            await component.execute(_make_task("Bad credentials"))
+
+        assert excinfo.value.__cause__ is error
+        assert llm.attempts == 1
+        sleep.assert_not_called()
+
+    async def test_server_error_retried_with_jitter(self, tmp_path):
+        error = errors.ServerError(503, {"error": {"message": "overloaded"}})
+        llm = _FlakyLLMClient([_text_content("ok")], error=error)
+        component = self._component(tmp_path, llm)
+
+        with patch("aurelia.components.base.asyncio.sleep", AsyncMock()) as sleep:
+            result = await component.execute(_make_task("Busy server"))
+
+        assert result.summary == "ok"
+        assert llm.attempts == 2
+        (delay,) = sleep.call_args.args
+        assert 0.5 <= delay <= 1.5
+
+    async def test_retry_after_header_honoured(self, tmp_path):
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        error = errors.ClientError(429, {"error": {"message": "slow down"}}, response)
+        llm = _FlakyLLMClient([_text_content("ok")], error=error)
+        component = self._component(tmp_path, llm)
+
+        with patch("aurelia.components.base.asyncio.sleep", AsyncMock()) as sleep:
+            await component.execute(_make_task("Rate limited"))
+
+        sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.parametrize(("header", "expected"), [("100000", 30.0), ("-5", 0.0)])
+    async def test_retry_after_header_clamped(self, tmp_path, header, expected):
+        response = httpx.Response(429, headers={"Retry-After": header})
+        error = errors.ClientError(429, {"error": {"message": "slow down"}}, response)
+        llm = _FlakyLLMClient([_text_content("ok")], error=error)
+        component = self._component(tmp_path, llm)
+
+        with patch("aurelia.components.base.asyncio.sleep", AsyncMock()) as sleep:
+            await component.execute(_make_task("Rate limited"))
+
+        sleep.assert_called_once_with(expected)
+
+    @pytest.mark.parametrize("header", ["inf", "nan"])
+    async def test_non_finite_retry_after_uses_backoff(self, tmp_path, header):
+        response = httpx.Response(429, headers={"Retry-After": header})
+        error = errors.ClientError(429, {"error": {"message": "slow down"}}, response)
+        llm = _FlakyLLMClient([_text_content("ok")], error=error)
+        component = self._component(tmp_path, llm)
+
+        with patch("aurelia.components.base.asyncio.sleep", AsyncMock()) as sleep:
+            await component.execute(_make_task("Rate limited"))
+
+        (delay,) = sleep.call_args.args
+        assert 0.5 <= delay <= 1.5
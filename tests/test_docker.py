@@ -13,6 +13,7 @@ from aurelia.sandbox.docker import (
     DockerClient,
     DockerNotAvailableError,
     ImageBuildError,
+    ensure_image,
 )
 
 
@@ -200,3 +201,58 @@ class TestRunContainer:
 
         assert result.exit_code == 1
         assert result.stderr == "error output"
+
+
+class TestEnsureImage:
+    def _client(self, image_exists: bool = False) -> AsyncMock:
+        client = AsyncMock(spec=DockerClient)
+        client.image_exists.return_value = image_exists
+        return client
+
+    async def test_checked_once_per_client_and_image(self, tmp_path):
+        client = self._client()
+        dockerfile = tmp_path / "Dockerfile"
+
+        await asyncio.gather(*(ensure_image(client, "img:1", dockerfile) for _ in range(3)))
+        await ensure_image(client, "img:1", dockerfile)
+
+        client.check_available.assert_called_once()
+        client.build_image.assert_called_once_with(dockerfile, "img:1")
+
+    async def test_other_image_checked_separately(self, tmp_path):
+        client = self._client(image_exists=True)
+
+        await ensure_image(client, "img:1", tmp_path / "Dockerfile")
+        await ensure_image(client, "img:2", tmp_path / "Dockerfile")
+
+        assert client.image_exists.call_count == 2
+
+    async def test_failed_check_retried(self, tmp_path):
+        client = self._client(image_exists=True)
+        client.check_available.side_effect = [DockerNotAvailableError("down"), None]
+
+        with pytest.raises(DockerNotAvailableError):
+            await ensure_image(client, "img:1", tmp_path / "Dockerfile")
+        await ensure_image(client, "img:1", tmp_path / "Dockerfile")
+
+        assert client.check_available.call_count == 2
+
+    async def test_on_build_called_around_build(self, tmp_path):
+        client = self._client()
+        stages: list[tuple[str, str]] = []
+
+        async def on_build(stage: str, image: str) -> None:
+            stages.append((stage, image))
+
+        await ensure_image(client, "img:1", tmp_path / "Dockerfile", on_build)
+
+        assert stages == [("started", "img:1"), ("completed", "img:1")]
+
+    async def test_no_build_when_image_exists(self, tmp_path):
+        client = self._client(image_exists=True)
+        on_build = AsyncMock()
+
+        await ensure_image(client, "img:1", tmp_path / "Dockerfile", on_build)
+
+        client.build_image.assert_not_called()
+        on_build.assert_not_called()
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import sys
 import textwrap
+import time
+from collections import OrderedDict
+from unittest.mock import AsyncMock, patch
 
-from aurelia.components.evaluator import EvaluatorComponent
+import pytest
+
+from aurelia.components.evaluator import EvaluatorComponent, _last_json_object, _parse_metrics
 from aurelia.core.events import EventLog
 from aurelia.core.ids import IdGenerator
-from aurelia.core.models import RuntimeState, Task, TaskStatus
+from aurelia.core.models import RuntimeState, SandboxConfig, Task, TaskStatus
+from aurelia.git.repo import GitRepo
 
 
 def _make_eval_task(worktree_path: str) -> Task:
@@ -133,3 +141,324 @@ class TestEvaluateEventsEmitted:
 
         completed = next(e for e in events if e.type == "eval.completed")
         assert completed.data["metrics"]["accuracy"] == 0.9
+
+
+class TestOutputTail:
+    async def test_long_output_keeps_trailing_json(self, tmp_path, monkeypatch):
+        import aurelia.sandbox.process as mod
+
+        monkeypatch.setattr(mod, "_OUTPUT_TAIL_BYTES", 4096)
+        monkeypatch.setattr(mod, "_READ_CHUNK_BYTES", 512)
+
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        _write_evaluate_py(
+            worktree,
+            """\
+            import json
+            for i in range(5000):
+                print(f"progress {i}")
+            print(json.dumps({"accuracy": 0.5}))
+            """,
+        )
+
+        event_log = EventLog(tmp_path / "events.jsonl")
+        evaluator = EvaluatorComponent(event_log, IdGenerator(RuntimeState()))
+
+        exit_code, stdout, _ = await evaluator._execute_subprocess(
+            str(worktree), "python evaluate.py"
+        )
+        assert exit_code == 0
+        assert len(stdout) <= 4096 + len(mod._TRUNCATED_MARKER)
+        assert stdout.startswith(mod._TRUNCATED_MARKER)
+        assert stdout.endswith(b'{"accuracy": 0.5}\n')
+
+        result = await evaluator.execute(_make_eval_task(str(worktree)))
+        assert result.metrics == {"accuracy": 0.5}
+
+
+class TestLastJsonObject:
+    def test_skips_trailing_non_json_lines(self):
+        text = b'Summary: ok\n{"accuracy": 0.9}\n{not json}\ndone\n'
+        assert _last_json_object(text) == {"accuracy": 0.9}
+
+    def test_prefers_last_object(self):
+        text = b'{"accuracy": 0.1}\n  {"accuracy": 0.2}  \n'
+        assert _last_json_object(text) == {"accuracy": 0.2}
+
+    def test_accepts_nan(self):
+        result = _last_json_object(b'log\n{"loss": NaN}')
+        assert result is not None and result["loss"] != result["loss"]
+
+    def test_no_object(self):
+        assert _last_json_object(b"") is None
+        assert _last_json_object(b"[1, 2]\n42\n{}\n") is None
+
+
+class TestEnsureImage:
+    async def test_image_checked_once_per_docker_client(self, tmp_path):
+        docker = AsyncMock()
+        docker.image_exists = AsyncMock(return_value=False)
+        event_log = EventLog(tmp_path / "events.jsonl")
+        id_gen = IdGenerator(RuntimeState())
+        evaluators = [
+            EvaluatorComponent(
+                event_log,
+                id_gen,
+                sandbox_config=SandboxConfig(image="aurelia-evaluator:latest"),
+                docker_client=docker,
+            )
+            for _ in range(3)
+        ]
+
+        await asyncio.gather(*(e._ensure_image() for e in evaluators))
+        await evaluators[0]._ensure_image()
+
+        docker.image_exists.assert_called_once()
+        docker.build_image.assert_called_once()
+
+    async def test_failed_build_retried(self, tmp_path):
+        docker = AsyncMock()
+        docker.image_exists = AsyncMock(return_value=False)
+        docker.build_image = AsyncMock(side_effect=[RuntimeError("build failed"), None])
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+            sandbox_config=SandboxConfig(image="aurelia-evaluator:latest"),
+            docker_client=docker,
+        )
+
+        with pytest.raises(RuntimeError):
+            await evaluator._ensure_image()
+        await evaluator._ensure_image()
+
+        assert docker.build_image.call_count == 2
+
+    async def test_image_check_starts_on_construction(self, tmp_path):
+        docker = AsyncMock()
+        docker.image_exists = AsyncMock(return_value=True)
+        EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"),
+            IdGenerator(RuntimeState()),
+            sandbox_config=SandboxConfig(image="aurelia-evaluator:latest"),
+            docker_client=docker,
+        )
+
+        await asyncio.sleep(0)
+
+        docker.image_exists.assert_called_once_with("aurelia-evaluator:latest")
+
+
+class TestEventBatching:
+    async def test_events_written_in_one_append(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        _write_evaluate_py(
+            worktree,
+            """\
+            import json
+            print(json.dumps({"accuracy": 0.9}))
+            """,
+        )
+
+        event_log = EventLog(tmp_path / "events.jsonl")
+        evaluator = EvaluatorComponent(event_log, IdGenerator(RuntimeState()))
+        task = _make_eval_task(str(worktree))
+        task.context["presubmit_checks"] = ["python -V"]
+
+        with patch.object(event_log, "append_batch", wraps=event_log.append_batch) as batch:
+            await evaluator.execute(task)
+
+        batch.assert_called_once()
+        events = await event_log.read_all()
+        assert [e.type for e in events] == [
+            "eval.presubmit_started",
+            "eval.presubmit_passed",
+            "eval.started",
+            "eval.completed",
+        ]
+        assert [e.seq for e in events] == sorted(e.seq for e in events)
+
+
+class TestBytesOutput:
+    async def test_metrics_parsed_after_invalid_utf8(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        _write_evaluate_py(
+            worktree,
+            """\
+            import sys
+            sys.stdout.buffer.write(b"progress \\xff\\xfe\\n")
+            sys.stdout.buffer.write(b'{"accuracy": 0.75}\\n')
+            """,
+        )
+
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"), IdGenerator(RuntimeState())
+        )
+        result = await evaluator.execute(_make_eval_task(str(worktree)))
+
+        assert result.metrics == {"accuracy": 0.75}
+
+    async def test_failure_message_is_decoded(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        _write_evaluate_py(
+            worktree,
+            """\
+            import sys
+            sys.stderr.buffer.write(b"bad byte \\xff")
+            sys.exit(2)
+            """,
+        )
+
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"), IdGenerator(RuntimeState())
+        )
+        result = await evaluator.execute(_make_eval_task(str(worktree)))
+
+        assert result.error == "bad byte �"
+
+
+class TestPresubmitChecks:
+    async def test_checks_run_concurrently(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        _write_evaluate_py(worktree, "print('{\"accuracy\": 1.0}')\n")
+
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"), IdGenerator(RuntimeState())
+        )
+        task = _make_eval_task(str(worktree))
+        sleep = f'{sys.executable} -c "import time; time.sleep(1)"'
+        task.context["presubmit_checks"] = [sleep, sleep, sleep]
+
+        start = time.monotonic()
+        result = await evaluator.execute(task)
+
+        assert result.error is None
+        assert time.monotonic() - start < 2.5
+
+    async def test_first_failure_stops_other_checks(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+
+        event_log = EventLog(tmp_path / "events.jsonl")
+        evaluator = EvaluatorComponent(event_log, IdGenerator(RuntimeState()))
+        task = _make_eval_task(str(worktree))
+        failing = f'{sys.executable} -c "import sys; sys.exit(3)"'
+        task.context["presubmit_checks"] = [
+            f'{sys.executable} -c "import time; time.sleep(60)"',
+            failing,
+        ]
+
+        result = await asyncio.wait_for(evaluator.execute(task), timeout=15)
+
+        assert result.error == f"Presubmit check '{failing}' failed (exit 3)"
+        events = await event_log.read_all()
+        assert [e.type for e in events] == ["eval.presubmit_started", "eval.presubmit_failed"]
+
+    async def test_failure_message_keeps_end_of_output(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        (worktree / "check.py").write_text(
+            "import sys\nsys.stderr.write('x' * 1000 + 'final error')\nsys.exit(1)\n"
+        )
+
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"), IdGenerator(RuntimeState())
+        )
+        task = _make_eval_task(str(worktree))
+        task.context["presubmit_checks"] = [f"{sys.executable} check.py"]
+
+        result = await evaluator.execute(task)
+
+        assert result.error.endswith("x" * 489 + "final error")
+
+
+class TestParseMetrics:
+    def test_whole_output_object(self):
+        assert _parse_metrics(b'{\n  "accuracy": 0.9,\n  "speed_ms": 3\n}\n') == {
+            "accuracy": 0.9,
+            "speed_ms": 3,
+        }
+
+    def test_empty_object_accepted_when_whole_output(self):
+        assert _parse_metrics(b"{}") == {}
+
+    def test_summary_then_json(self):
+        assert _parse_metrics(b'Accuracy: 90%\n{"accuracy": 0.9}\n') == {"accuracy": 0.9}
+
+    def test_braced_log_lines_fall_back_to_tail(self):
+        assert _parse_metrics(b'{"step": 1}\n{"accuracy": 0.9}') == {"accuracy": 0.9}
+
+    def test_non_object_output(self):
+        assert _parse_metrics(b"[0.9]") is None
+        assert _parse_metrics(b"") is None
+
+
+class TestResultCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        import aurelia.components.evaluator as mod
+
+        monkeypatch.setattr(mod, "_RESULT_CACHE", OrderedDict())
+
+    async def _git_worktree(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        repo = GitRepo(worktree)
+        await repo.init()
+        await repo._run("config", "user.email", "test@test.com")
+        await repo._run("config", "user.name", "Test User")
+        runs = tmp_path / "runs.log"
+        _write_evaluate_py(
+            worktree,
+            f"""\
+            import json
+            with open({str(runs)!r}, "a") as f:
+                f.write("run\\n")
+            print(json.dumps({{"accuracy": 0.8}}))
+            """,
+        )
+        await repo._run("add", "evaluate.py")
+        await repo._run("commit", "-m", "add evaluate.py")
+        return worktree, repo, runs
+
+    async def test_clean_worktree_evaluated_once(self, tmp_path):
+        worktree, _, runs = await self._git_worktree(tmp_path)
+        event_log = EventLog(tmp_path / "events.jsonl")
+        evaluator = EvaluatorComponent(event_log, IdGenerator(RuntimeState()))
+
+        first = await evaluator.execute(_make_eval_task(str(worktree)))
+        second = await evaluator.execute(_make_eval_task(str(worktree)))
+
+        assert first.metrics == second.metrics == {"accuracy": 0.8}
+        assert first.id != second.id
+        assert runs.read_text() == "run\n"
+        events = await event_log.read_all()
+        assert [e.type for e in events][-1] == "eval.cached"
+
+    async def test_dirty_worktree_not_cached(self, tmp_path):
+        worktree, _, runs = await self._git_worktree(tmp_path)
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"), IdGenerator(RuntimeState())
+        )
+
+        await evaluator.execute(_make_eval_task(str(worktree)))
+        (worktree / "notes.txt").write_text("uncommitted")
+        await evaluator.execute(_make_eval_task(str(worktree)))
+
+        assert runs.read_text() == "run\nrun\n"
+
+    async def test_different_command_not_shared(self, tmp_path):
+        worktree, _, runs = await self._git_worktree(tmp_path)
+        evaluator = EvaluatorComponent(
+            EventLog(tmp_path / "events.jsonl"), IdGenerator(RuntimeState())
+        )
+
+        await evaluator.execute(_make_eval_task(str(worktree)))
+        task = _make_eval_task(str(worktree))
+        task.context["eval_command"] = "python ./evaluate.py"
+        await evaluator.execute(task)
+
+        assert runs.read_text() == "run\nrun\n"
@@ -36,6 +36,20 @@ class TestAppendAndReadAll:
         assert await log.read_all() == []
 
 
+class TestAppendBatch:
+    async def test_batch_appended_in_order(self, tmp_path):
+        log = EventLog(tmp_path / "events.jsonl")
+        await log.append(_event(1))
+        await log.append_batch([_event(2), _event(3)])
+
+        assert [e.seq for e in await log.read_all()] == [1, 2, 3]
+
+    async def test_empty_batch_creates_nothing(self, tmp_path):
+        log_path = tmp_path / "events.jsonl"
+        await EventLog(log_path).append_batch([])
+        assert not log_path.exists()
+
+
 class TestReadSince:
     async def test_filters_by_seq(self, tmp_path):
         log = EventLog(tmp_path / "events.jsonl")
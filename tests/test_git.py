@@ -115,6 +115,46 @@ class TestNotes:
         assert notes == []
 
 
+class TestCleanTreeHash:
+    async def test_returns_head_tree_when_clean(self, repo, tmp_path):
+        test_file = tmp_path / "tracked.txt"
+        test_file.write_text("committed")
+        await repo.commit("main", "Add tracked", [test_file])
+
+        tree = await repo.clean_tree_hash()
+        assert tree == await repo._run("rev-parse", "HEAD^{tree}")
+
+    async def test_none_with_modified_or_untracked_files(self, repo, tmp_path):
+        test_file = tmp_path / "tracked.txt"
+        test_file.write_text("committed")
+        await repo.commit("main", "Add tracked", [test_file])
+
+        test_file.write_text("modified")
+        assert await repo.clean_tree_hash() is None
+
+        test_file.write_text("committed")
+        (tmp_path / "untracked.txt").write_text("new")
+        assert await repo.clean_tree_hash() is None
+
+    async def test_ignores_gitignored_files(self, repo, tmp_path):
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("build/\n")
+        await repo.commit("main", "Add gitignore", [gitignore])
+
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.bin").write_text("artefact")
+        assert await repo.clean_tree_hash() is not None
+
+    async def test_none_for_subdirectory(self, repo, tmp_path):
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        test_file = sub / "file.txt"
+        test_file.write_text("content")
+        await repo.commit("main", "Add sub", [test_file])
+
+        assert await GitRepo(sub).clean_tree_hash() is None
+
+
 class TestShow:
     async def test_show_file_content(self, repo, tmp_path):
         test_file = tmp_path / "show_test.txt"
@@ -18,6 +18,26 @@ class TestCLIGroup:
         for cmd in ("init", "start", "stop", "status", "replay", "monitor", "report"):
             assert cmd in result.output
 
+    def test_help_skips_command_imports(self):
+        """Test that --help only loads the CLI module, not the command bodies."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from aurelia.cli.main import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('aurelia')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        loaded = result.stdout.strip().splitlines()[-1]
+        assert loaded == "['aurelia', 'aurelia.cli', 'aurelia.cli.main']"
+
     def test_init_command_exists(self):
         """Verify the init command is registered."""
         runner = CliRunner()
@@ -44,6 +64,81 @@ class TestCLIGroup:
         assert result.exit_code == 0
         assert "--project-dir" in result.output
 
+    def test_stop_without_pid_file(self, tmp_path):
+        runner = CliRunner()
+        result = runner.invoke(cli, ["stop", "--project-dir", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "No PID file found" in result.output
+
+    def test_status_without_state(self, tmp_path):
+        runner = CliRunner()
+        result = runner.invoke(cli, ["status", "--project-dir", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "No state directory found" in result.output
+
+        (tmp_path / ".aurelia" / "state").mkdir(parents=True)
+        result = runner.invoke(cli, ["status", "--project-dir", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "No runtime state found" in result.output
+
+    def test_missing_project_dir_is_reported_by_the_command(self, tmp_path):
+        runner = CliRunner()
+        missing = str(tmp_path / "missing")
+
+        result = runner.invoke(cli, ["status", "--project-dir", missing])
+        assert result.exit_code == 1
+        assert "No state directory found" in result.output
+
+        result = runner.invoke(cli, ["report", "--project-dir", missing])
+        assert "No .aurelia/state directory" in result.output
+
+
+class TestResetState:
+    """Tests for clearing runtime state with `aurelia reset`."""
+
+    def test_reset_removes_aurelia_worktrees_and_branches(self, tmp_path):
+        import subprocess
+
+        from aurelia.cli.main import _reset_state
+
+        def git(*args: str) -> str:
+            result = subprocess.run(
+                ["git", *args], cwd=tmp_path, capture_output=True, text=True, check=True
+            )
+            return result.stdout
+
+        git("init", "-b", "main")
+        git("commit", "--allow-empty", "-m", "Initial commit")
+        for name in ("cand-0001", "cand-0002", "cand-0003"):
+            git("branch", f"aurelia/{name}")
+        wt_path = tmp_path / ".aurelia" / "worktrees" / "aurelia" / "cand-0001"
+        git("worktree", "add", str(wt_path), "aurelia/cand-0001")
+
+        _reset_state(tmp_path)
+
+        assert git("branch", "--list", "aurelia/*").strip() == ""
+        assert str(wt_path) not in git("worktree", "list")
+        assert not wt_path.exists()
+        assert git("branch", "--show-current").strip() == "main"
+
+
+class TestAbsolutePath:
+    def test_absolute_path_is_kept(self, tmp_path):
+        from aurelia.cli.main import _absolute
+
+        assert _absolute(tmp_path) == tmp_path
+
+    def test_relative_path_is_made_absolute(self, tmp_path, monkeypatch):
+        from pathlib import Path
+
+        from aurelia.cli.main import _absolute
+
+        (tmp_path / "project").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        assert _absolute(Path("project")) == Path.cwd() / "project"
+        assert _absolute(Path("project/../project")) == (tmp_path / "project").resolve()
+
 
 class TestInitWizardPrerequisites:
     """Tests for the prerequisites check."""
@@ -53,7 +148,10 @@ class TestInitWizardPrerequisites:
         from aurelia.cli.init_cmd import _check_prerequisites
 
         # Mock shutil.which to return paths for all tools
-        with patch("aurelia.cli.init_cmd.shutil.which") as mock_which:
+        with (
+            patch("aurelia.cli.init_cmd.shutil.which") as mock_which,
+            patch.dict("aurelia.cli.init_cmd._TOOLS", clear=True),
+        ):
             mock_which.return_value = "/usr/bin/mock"
             result = _check_prerequisites()
             assert result is True
@@ -68,10 +166,24 @@ class TestInitWizardPrerequisites:
                 return None
             return "/usr/bin/mock"
 
-        with patch("aurelia.cli.init_cmd.shutil.which", side_effect=mock_which):
+        with (
+            patch("aurelia.cli.init_cmd.shutil.which", side_effect=mock_which),
+            patch.dict("aurelia.cli.init_cmd._TOOLS", clear=True),
+        ):
             result = _check_prerequisites()
             assert result is False
 
+    def test_check_prerequisites_caches_tool_paths(self):
+        """Test that resolved tool paths are kept for later spawns."""
+        from aurelia.cli.init_cmd import _TOOLS, _check_prerequisites
+
+        with (
+            patch("aurelia.cli.init_cmd.shutil.which", side_effect=lambda cmd: f"/opt/{cmd}"),
+            patch.dict("aurelia.cli.init_cmd._TOOLS", clear=True),
+        ):
+            assert _check_prerequisites() is True
+            assert _TOOLS == {"gemini": "/opt/gemini", "git": "/opt/git", "pixi": "/opt/pixi"}
+
 
 class TestInitWizardAPIKey:
     """Tests for API key setup."""
@@ -140,15 +252,38 @@ class TestInitWizardFileCreation:
 
         assert not (tmp_path / "solution.py").exists()
 
+    def test_open_editor_reports_saved_file(self, tmp_path, capsys):
+        """Test that a successful edit reports the file as saved."""
+        from aurelia.cli.init_cmd import _open_editor
+
+        path = tmp_path / "README.md"
+        with patch.dict(os.environ, {"EDITOR": "true"}):
+            _open_editor(path, "# Problem Statement\n")
+
+        assert path.read_text() == "# Problem Statement\n"
+        assert "README.md saved." in capsys.readouterr().out
+
+    def test_open_editor_failure_skips_check(self, tmp_path, capsys):
+        """Test that a failing editor is reported instead of the file state."""
+        from aurelia.cli.init_cmd import _open_editor
+
+        path = tmp_path / "README.md"
+        with patch.dict(os.environ, {"EDITOR": "false"}):
+            _open_editor(path)
+
+        out = capsys.readouterr().out
+        assert "Editor exited with code 1" in out
+        assert "empty or missing" not in out
+
 
 class TestInitWizardConfig:
     """Tests for configuration file generation."""
 
-    def test_setup_pixi_config(self, tmp_path):
-        """Test pixi.toml generation."""
-        from aurelia.cli.init_cmd import _setup_pixi_config
+    def test_setup_project_files(self, tmp_path):
+        """Test pixi.toml, pyproject.toml and tests package generation."""
+        from aurelia.cli.init_cmd import _setup_project_files
 
-        _setup_pixi_config(tmp_path)
+        _setup_project_files(tmp_path)
 
         pixi_path = tmp_path / "pixi.toml"
         assert pixi_path.exists()
@@ -160,23 +295,6 @@ class TestInitWizardConfig:
         assert "test = " in content
         assert "evaluate = " in content
 
-    def test_setup_pixi_config_already_exists(self, tmp_path):
-        """Test that existing pixi.toml is not overwritten."""
-        from aurelia.cli.init_cmd import _setup_pixi_config
-
-        pixi_path = tmp_path / "pixi.toml"
-        pixi_path.write_text("# Existing config")
-
-        _setup_pixi_config(tmp_path)
-
-        assert pixi_path.read_text() == "# Existing config"
-
-    def test_setup_pyproject(self, tmp_path):
-        """Test pyproject.toml generation."""
-        from aurelia.cli.init_cmd import _setup_pyproject
-
-        _setup_pyproject(tmp_path)
-
         pyproject_path = tmp_path / "pyproject.toml"
         assert pyproject_path.exists()
 
@@ -185,6 +303,38 @@ class TestInitWizardConfig:
         assert "[tool.ruff]" in content
         assert "[tool.pytest.ini_options]" in content
 
+        tests_dir = tmp_path / "tests"
+        assert tests_dir.exists()
+        assert (tests_dir / "__init__.py").exists()
+
+    def test_setup_project_files_sanitizes_name(self, tmp_path):
+        """Test that the project name keeps only alphanumerics and dashes."""
+        from aurelia.cli.init_cmd import _setup_project_files
+
+        project_dir = tmp_path / "My Cool_Project (v2)"
+        project_dir.mkdir()
+
+        _setup_project_files(project_dir)
+
+        assert 'name = "my-coolproject-v2"' in (project_dir / "pixi.toml").read_text()
+        assert 'name = "my-coolproject-v2"' in (project_dir / "pyproject.toml").read_text()
+
+    def test_setup_project_files_already_exist(self, tmp_path):
+        """Test that existing config files are not overwritten."""
+        from aurelia.cli.init_cmd import _setup_project_files
+
+        pixi_path = tmp_path / "pixi.toml"
+        pixi_path.write_text("# Existing config")
+        (tmp_path / "tests").mkdir()
+        init_file = tmp_path / "tests" / "__init__.py"
+        init_file.write_text("# Existing package")
+
+        _setup_project_files(tmp_path)
+
+        assert pixi_path.read_text() == "# Existing config"
+        assert init_file.read_text() == "# Existing package"
+        assert (tmp_path / "pyproject.toml").exists()
+
     def test_setup_aurelia_config(self, tmp_path):
         """Test .aurelia directory structure creation."""
         from aurelia.cli.init_cmd import _setup_aurelia_config
@@ -198,15 +348,65 @@ class TestInitWizardConfig:
         assert (aurelia_dir / "config").exists()
         assert (aurelia_dir / "config" / "workflow.yaml").exists()
 
-    def test_setup_tests_dir(self, tmp_path):
-        """Test tests directory creation."""
-        from aurelia.cli.init_cmd import _setup_tests_dir
+    def test_setup_aurelia_config_appends_to_gitignore(self, tmp_path):
+        """Test that .aurelia/ is appended to an existing .gitignore once."""
+        from aurelia.cli.init_cmd import _setup_aurelia_config
 
-        _setup_tests_dir(tmp_path)
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("__pycache__/")
 
-        tests_dir = tmp_path / "tests"
-        assert tests_dir.exists()
-        assert (tests_dir / "__init__.py").exists()
+        _setup_aurelia_config(tmp_path)
+        _setup_aurelia_config(tmp_path)
+
+        assert gitignore.read_text() == "__pycache__/\n\n# Aurelia runtime state\n.aurelia/\n"
+
+    def test_ensure_git_repo_creates_initial_commit(self, tmp_path):
+        """Test that a new repo gets a main branch with everything committed."""
+        import subprocess
+
+        from aurelia.cli.init_cmd import _ensure_git_repo
+
+        (tmp_path / "solution.py").write_text("x = 1\n")
+
+        _ensure_git_repo(tmp_path)
+
+        branch = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        files = subprocess.run(
+            ["git", "ls-files"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert branch.stdout.strip() == "main"
+        assert files.stdout.split() == ["solution.py"]
+
+    def test_initial_commit_skips_aurelia_state(self, tmp_path):
+        """Test that runtime state under .aurelia/ is not indexed."""
+        import subprocess
+
+        from aurelia.cli.init_cmd import _ensure_git_repo, _setup_aurelia_config
+
+        (tmp_path / "solution.py").write_text("x = 1\n")
+        _setup_aurelia_config(tmp_path)
+        (tmp_path / ".aurelia" / "cache" / "blob.bin").write_bytes(b"\0" * 16)
+
+        _ensure_git_repo(tmp_path)
+
+        files = subprocess.run(
+            ["git", "ls-files"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert files.stdout.split() == [".gitignore", "solution.py"]
 
 
 class TestWizardPrompts:
@@ -53,3 +53,25 @@ class TestHashDeterminism:
         h1 = cache.request_hash("m", [], {}, [{"name": "a"}])
         h2 = cache.request_hash("m", [], {}, [{"name": "b"}])
         assert h1 != h2
+
+
+class TestMemoryLayer:
+    async def test_memory_only_round_trip(self):
+        cache = LLMCache(None)
+        await cache.store("h", {"text": "hi"}, {})
+        assert await cache.lookup("h") == {"text": "hi"}
+
+    async def test_least_recently_used_entry_evicted(self):
+        cache = LLMCache(None, max_entries=2)
+        await cache.store("a", {"n": 1}, {})
+        await cache.store("b", {"n": 2}, {})
+        await cache.lookup("a")
+        await cache.store("c", {"n": 3}, {})
+
+        assert await cache.lookup("b") is None
+        assert await cache.lookup("a") == {"n": 1}
+        assert await cache.lookup("c") == {"n": 3}
+
+    async def test_disk_entry_survives_new_instance(self, tmp_path):
+        await LLMCache(tmp_path).store("h", {"text": "persisted"}, {})
+        assert await LLMCache(tmp_path).lookup("h") == {"text": "persisted"}
@@ -0,0 +1,146 @@
+"""Tests for host subprocess helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+import sys
+
+import pytest
+
+from aurelia.sandbox.process import (
+    command_argv,
+    communicate_tail,
+    kill_process_group,
+    spawn_command,
+)
+
+
+class TestCommandArgv:
+    @pytest.mark.parametrize(
+        ("command", "argv"),
+        [
+            ("pixi run evaluate", ["pixi", "run", "evaluate"]),
+            ("python evaluate.py --out 'a b'", ["python", "evaluate.py", "--out", "a b"]),
+            ("  pytest   -q  ", ["pytest", "-q"]),
+        ],
+    )
+    def test_plain_commands_are_split(self, command, argv):
+        assert command_argv(command) == argv
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "pytest && ruff check .",
+            "python evaluate.py | tail -1",
+            "python evaluate.py > out.json",
+            "echo $HOME",
+            "ls *.py",
+            'python -c "import sys; sys.exit(1)"',
+            "FOO=1 python evaluate.py",
+            "cd sub",
+            "echo 'unterminated",
+            "",
+        ],
+    )
+    def test_shell_syntax_needs_a_shell(self, command):
+        assert command_argv(command) is None
+
+
+class TestSpawnCommand:
+    async def test_exec_runs_without_shell(self, tmp_path):
+        proc = await spawn_command(f"{sys.executable} -c 'print(42)'", str(tmp_path))
+        stdout, _ = await proc.communicate()
+        assert proc.returncode == 0
+        assert stdout == b"42\n"
+
+    async def test_shell_fallback(self, tmp_path):
+        proc = await spawn_command("echo one && echo two", str(tmp_path))
+        stdout, _ = await proc.communicate()
+        assert stdout == b"one\ntwo\n"
+
+    async def test_missing_program_reported_by_shell(self, tmp_path):
+        proc = await spawn_command("aurelia-no-such-program --flag", str(tmp_path))
+        _, stderr = await proc.communicate()
+        assert proc.returncode == 127
+        assert b"not found" in stderr
+
+    async def test_script_without_shebang_runs_under_shell(self, tmp_path):
+        script = tmp_path / "run.sh"
+        script.write_text("echo from script\n")
+        script.chmod(0o755)
+        proc = await spawn_command("./run.sh", str(tmp_path))
+        stdout, _ = await proc.communicate()
+        assert proc.returncode == 0
+        assert stdout == b"from script\n"
+
+    async def test_not_a_directory_reported_by_shell(self, tmp_path):
+        (tmp_path / "file").write_text("")
+        proc = await spawn_command("./file/x", str(tmp_path))
+        await proc.communicate()
+        assert proc.returncode != 0
+
+
+class TestKillProcessGroup:
+    async def test_sigterm_handler_gets_to_run(self, tmp_path):
+        marker = tmp_path / "stopped"
+        script = (
+            "import signal, sys, time\n"
+            "def stop(*_):\n"
+            f"    open({str(marker)!r}, 'w').close()\n"
+            "    sys.exit(0)\n"
+            "signal.signal(signal.SIGTERM, stop)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(60)\n"
+        )
+        (tmp_path / "child.py").write_text(script)
+        proc = await spawn_command(f"{sys.executable} child.py", str(tmp_path))
+        await proc.stdout.readline()
+
+        await kill_process_group(proc, grace=5)
+
+        assert marker.exists()
+        assert proc.returncode == 0
+
+    async def test_escalates_to_sigkill(self, tmp_path):
+        script = (
+            "import signal, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(60)\n"
+        )
+        (tmp_path / "child.py").write_text(script)
+        proc = await spawn_command(f"{sys.executable} child.py", str(tmp_path))
+        await proc.stdout.readline()
+
+        await asyncio.wait_for(kill_process_group(proc, grace=0.2), timeout=10)
+
+        assert proc.returncode == -signal.SIGKILL
+
+
+class TestCommunicateTail:
+    async def _run(self, tmp_path, script: str) -> tuple[bytes, bytes]:
+        (tmp_path / "child.py").write_text(script)
+        proc = await spawn_command(f"{sys.executable} child.py", str(tmp_path))
+        return await communicate_tail(proc)
+
+    async def test_short_output_kept_whole(self, tmp_path):
+        stdout, stderr = await self._run(
+            tmp_path, "import sys\nprint('out')\nprint('err', file=sys.stderr)\n"
+        )
+        assert stdout == b"out\n"
+        assert stderr == b"err\n"
+
+    async def test_long_output_truncated_to_tail(self, tmp_path, monkeypatch):
+        import aurelia.sandbox.process as mod
+
+        monkeypatch.setattr(mod, "_OUTPUT_TAIL_BYTES", 1000)
+        monkeypatch.setattr(mod, "_READ_CHUNK_BYTES", 64)
+
+        stdout, _ = await self._run(
+            tmp_path, "for i in range(10000):\n    print(i)\nprint('last')\n"
+        )
+
+        assert stdout.startswith(mod._TRUNCATED_MARKER)
+        assert len(stdout) == 1000 + len(mod._TRUNCATED_MARKER)
+        assert stdout.endswith(b"9999\nlast\n")
@@ -164,3 +164,203 @@ class TestReportFailures:
         assert result.exit_code == 0
         assert "Failures" in result.output
         assert "pixi run test" in result.output
+
+
+class TestLoadJsonCache:
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        from aurelia.cli.report_cmd import _load_json
+
+        path = tmp_path / "tasks.json"
+        path.write_text(json.dumps([{"component": "coder"}]))
+
+        first = _load_json(path)
+        assert _load_json(path) is first
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        import os
+
+        from aurelia.cli.report_cmd import _load_json
+
+        path = tmp_path / "tasks.json"
+        path.write_text(json.dumps([{"component": "coder"}]))
+        assert _load_json(path) == [{"component": "coder"}]
+
+        path.write_text(json.dumps([{"component": "planner"}]))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert _load_json(path) == [{"component": "planner"}]
+
+    def test_projection_interns_repeated_strings(self, tmp_path):
+        from aurelia.cli.report_cmd import _load_json, _project_candidates
+
+        path = tmp_path / "candidates.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"id": "cand-0001", "status": "failed", "branch": "aurelia/cand-0001"},
+                    {"id": "cand-0002", "status": "failed", "branch": "aurelia/cand-0002"},
+                ]
+            )
+        )
+
+        first, second = _load_json(path, _project_candidates)
+        assert first["status"] is second["status"]
+
+    def test_corrupt_file_returns_none(self, tmp_path):
+        from aurelia.cli.report_cmd import _load_json
+
+        path = tmp_path / "tasks.json"
+        path.write_text("{not json")
+
+        assert _load_json(path) is None
+        assert _load_json(tmp_path / "missing.json") is None
+
+    def test_nan_metrics_are_parsed(self, tmp_path):
+        import math
+
+        from aurelia.cli.report_cmd import _load_json
+
+        path = tmp_path / "evaluations.json"
+        path.write_text(json.dumps([{"metrics": {"score": float("nan")}}]))
+
+        data = _load_json(path)
+        assert math.isnan(data[0]["metrics"]["score"])
+
+    def test_projection_drops_unused_fields(self, tmp_path):
+        from aurelia.cli.report_cmd import _load_json, _project_tasks
+
+        path = tmp_path / "tasks.json"
+        task = {
+            "component": "coder",
+            "status": "failed",
+            "branch": "aurelia/cand-0001",
+            "instruction": "x" * 1000,
+            "result": {"error": "boom", "transcript": "y" * 1000},
+        }
+        path.write_text(json.dumps([task]))
+
+        assert _load_json(path, _project_tasks) == [
+            {
+                "component": "coder",
+                "status": "failed",
+                "branch": "aurelia/cand-0001",
+                "result": {"error": "boom"},
+            }
+        ]
+
+
+class TestTimeFormatting:
+    def test_parse_time_accepts_trailing_z(self):
+        from datetime import UTC, datetime
+
+        from aurelia.cli.report_cmd import _parse_time
+
+        assert _parse_time("2025-01-01T00:05:30Z") == datetime(2025, 1, 1, 0, 5, 30, tzinfo=UTC)
+
+    def test_fmt_time_passes_through_unparseable(self):
+        from aurelia.cli.report_cmd import _fmt_time
+
+        assert _fmt_time("2025-01-01T00:05:30Z") == "2025-01-01 00:05:30 UTC"
+        assert _fmt_time("yesterday") == "yesterday"
+
+
+class TestBestCandidate:
+    def test_best_is_highest_average_passing_evaluation(self):
+        from aurelia.cli.report_cmd import _aggregate
+
+        evaluations = [
+            {"id": "eval-1", "passed": True, "metrics": {"a": 0.5, "b": 0.5}},
+            {"id": "eval-2", "passed": False, "metrics": {"a": 9.0}},
+            {"id": "eval-3", "passed": True, "metrics": {"a": 1.0, "note": "x"}},
+            {"id": "eval-4", "passed": True, "metrics": {"a": 0.25, "b": 1.75}},
+        ]
+
+        assert _aggregate([], evaluations, []).best["id"] == "eval-3"
+
+    def test_no_numeric_metrics_means_no_best(self):
+        from aurelia.cli.report_cmd import _aggregate
+
+        evaluations = [{"id": "eval-1", "passed": True, "metrics": {"note": "x"}}]
+
+        assert _aggregate([], evaluations, []).best is None
+
+
+class TestReportMaxRows:
+    def test_tables_are_truncated(self, tmp_path):
+        project = tmp_path / "project"
+        runtime = {"status": "stopped"}
+        candidates = [
+            {"id": f"cand-{i:04d}", "status": "succeeded", "branch": f"aurelia/cand-{i:04d}"}
+            for i in range(5)
+        ]
+        evaluations = [
+            {"id": f"eval-{i:04d}", "candidate_branch": f"aurelia/cand-{i:04d}", "metrics": {}}
+            for i in range(5)
+        ]
+
+        _write_state(project / ".aurelia" / "state", runtime, candidates, evaluations, [])
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["report", "--project-dir", str(project), "--max-rows", "2"])
+
+        assert result.exit_code == 0
+        assert "cand-0001" in result.output
+        assert "cand-0002" not in result.output
+        assert "eval-0002" not in result.output
+        assert result.output.count("... and 3 more") == 2
+
+        result = runner.invoke(cli, ["report", "--project-dir", str(project), "--max-rows", "0"])
+        assert "cand-0004" in result.output
+        assert "eval-0004" in result.output
+        assert "more (use --max-rows" not in result.output
+
+
+class TestReportCache:
+    def _state(self, tmp_path) -> Path:
+        state_dir = tmp_path / "project" / ".aurelia" / "state"
+        candidates = [{"id": "cand-0001", "status": "succeeded", "branch": "aurelia/cand-0001"}]
+        _write_state(state_dir, {"status": "running"}, candidates, [], [])
+        return state_dir
+
+    def test_unchanged_state_replays_cached_report(self, tmp_path):
+        state_dir = self._state(tmp_path)
+        runner = CliRunner()
+        args = ["report", "--project-dir", str(state_dir.parent.parent)]
+
+        first = runner.invoke(cli, args)
+        assert (state_dir / ".report.cache").exists()
+
+        # Doctor the cached body: a replay must print it verbatim
+        cache = state_dir / ".report.cache"
+        key, _, body = cache.read_text().partition("\n")
+        cache.write_text(f"{key}\n{body.replace('running', 'cached')}")
+
+        second = runner.invoke(cli, args)
+        assert "running" in first.output
+        assert "cached" in second.output
+
+    def test_changed_state_rerenders(self, tmp_path):
+        import os
+
+        state_dir = self._state(tmp_path)
+        runner = CliRunner()
+        args = ["report", "--project-dir", str(state_dir.parent.parent)]
+        runner.invoke(cli, args)
+
+        runtime = state_dir / "runtime.json"
+        runtime.write_text(json.dumps({"status": "stopped"}))
+        st = runtime.stat()
+        os.utime(runtime, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        result = runner.invoke(cli, args)
+        assert "stopped" in result.output
+
+    def test_row_limit_is_part_of_the_key(self, tmp_path):
+        state_dir = self._state(tmp_path)
+        runner = CliRunner()
+        args = ["report", "--project-dir", str(state_dir.parent.parent)]
+        runner.invoke(cli, args)
+
+        result = runner.invoke(cli, [*args, "--max-rows", "0"])
+        assert "rows=0" in (state_dir / ".report.cache").read_text().partition("\n")[0]
+        assert "cand-0001" in result.output